@@ -0,0 +1,71 @@
+# -*- mode: python ; coding: utf-8 -*-
+# PyInstaller spec for Shikimori Updater (--onedir build)
+# Build with: python build.py
+
+import os
+import sys
+
+sys.path.insert(0, SPECPATH)
+from build import EXCLUDED_MODULES, UPX_EXCLUDES, STAGED_SRC_ENV
+
+# Application sources are imported from src/ at runtime, so ship them as data
+# and let Analysis follow their imports into third-party packages.
+# build.py precompiles a copy of src/ with -OO and passes its path in
+# STAGED_SRC_ENV, ship those .pyc files instead of sources
+datas = []
+staged_dir = os.environ.get(STAGED_SRC_ENV)
+src_dir = staged_dir if staged_dir and os.path.isdir(staged_dir) else os.path.join(SPECPATH, 'src')
+for dirpath, dirnames, filenames in os.walk(src_dir):
+    dirnames[:] = [d for d in dirnames if d != '__pycache__']
+    dest = os.path.normpath(os.path.join('src', os.path.relpath(dirpath, src_dir)))
+    for filename in filenames:
+        if filename.endswith('.py') and filename + 'c' in filenames:
+            continue
+        if filename.endswith('.pyc') and src_dir != staged_dir:
+            # Leftovers next to the sources, not built for this bundle
+            continue
+        datas.append((os.path.join(dirpath, filename), dest))
+for icon_file in ('icon.png', 'icon.ico'):
+    if os.path.exists(os.path.join(SPECPATH, icon_file)):
+        datas.append((os.path.join(SPECPATH, icon_file), '.'))
+
+icon_path = os.path.join(SPECPATH, 'icon.ico')
+
+a = Analysis(
+    [os.path.join(SPECPATH, 'main.py')],
+    pathex=[os.path.join(SPECPATH, 'src')],
+    binaries=[],
+    datas=datas,
+    hiddenimports=[],
+    hookspath=[],
+    hooksconfig={},
+    runtime_hooks=[],
+    excludes=EXCLUDED_MODULES,
+    noarchive=False,
+    optimize=2,
+)
+pyz = PYZ(a.pure)
+
+exe = EXE(
+    pyz,
+    a.scripts,
+    [],
+    exclude_binaries=True,
+    name='Shikimori Updater',
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip=False,
+    upx=True,
+    console=False,
+    icon=icon_path if os.path.exists(icon_path) else None,
+)
+
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.datas,
+    strip=False,
+    upx=True,
+    upx_exclude=UPX_EXCLUDES,
+    name='Shikimori Updater',
+)
@@ -5,34 +5,241 @@ Build script for creating Shikimori Updater executable
 
 import os
 import sys
+import argparse
+import compileall
+import hashlib
+import importlib.util
 import subprocess
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Modules never used at runtime; excluding them keeps the bundle small
+EXCLUDED_MODULES = [
+    "unittest",
+    "pydoc",
+    "pydoc_data",
+    "xmlrpc",
+    "distutils",
+    "lib2to3",
+    "test",
+    "turtledemo",
+    "idlelib",
+    "tkinter.test",
+    "PIL.ImageQt",
+    "email.test",
+]
+
+# Project-local UPX location, checked before PATH
+UPX_DIR = os.path.join(".tools", "upx")
+
+# Local build state that is not worth committing
+BUILD_CACHE_DIR = ".build_cache"
+PYINSTALLER_SENTINEL = os.path.join(BUILD_CACHE_DIR, "pyinstaller_ok")
+
+# Finished application folders kept in BUILD_CACHE_DIR, keyed by source hash
+APP_DIR = os.path.join("dist", "Shikimori Updater")
+SPEC_FILES = ["Shikimori Updater.spec", "shikimori_updater.spec"]
+BUILD_INPUTS = ["main.py", "requirements.txt", "build.py", "icon.png", "icon.ico"] + SPEC_FILES
+MAX_CACHED_BUILDS = 5
+
+# Environment variable telling the spec file where the precompiled src/ copy is
+STAGED_SRC_ENV = "SHIKIMORI_STAGED_SRC"
+
+# DLLs known to break when compressed with UPX
+UPX_EXCLUDES = [
+    "vcruntime140.dll",
+    "python3.dll",
+    f"python{sys.version_info.major}{sys.version_info.minor}.dll",
+    "qwindows.dll",
+]
+
+def interpreter_key():
+    """Short hash identifying the current interpreter"""
+    return hashlib.md5(f"{sys.executable}|{sys.version}".encode('utf-8')).hexdigest()[:12]
+
+def _pyinstaller_version():
+    """Installed PyInstaller version, read from package metadata"""
+    from importlib import metadata
+    try:
+        return metadata.version("pyinstaller")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+def _installed_packages_digest():
+    """Hash of name==version for every installed distribution
+    
+    Covers the bundled dependencies and their own dependencies, so
+    upgrading any of them invalidates cached builds.
+    """
+    from importlib import metadata
+    packages = sorted(f"{(dist.metadata['Name'] or '').lower()}=={dist.version}"
+                      for dist in metadata.distributions())
+    return hashlib.blake2b("\n".join(packages).encode('utf-8'), digest_size=16).hexdigest()
+
+def _read_pyinstaller_sentinel():
+    """Interpreter key stored by the last successful check, None if missing"""
+    try:
+        with open(PYINSTALLER_SENTINEL, 'r', encoding='utf-8') as f:
+            return f.readline().strip()
+    except OSError:
+        return None
+
+def _write_pyinstaller_sentinel():
+    """Remember that PyInstaller is available for this interpreter"""
+    try:
+        os.makedirs(BUILD_CACHE_DIR, exist_ok=True)
+        with open(PYINSTALLER_SENTINEL, 'w', encoding='utf-8') as f:
+            f.write(f"{interpreter_key()}\n")
+            f.write(f"PyInstaller {_pyinstaller_version()}\n")
+            f.write(f"Python {sys.version.split()[0]}\n")
+    except OSError:
+        pass
 
 def check_pyinstaller():
     """Check if PyInstaller is installed"""
-    try:
-        import PyInstaller
+    if _read_pyinstaller_sentinel() == interpreter_key():
         print("[OK] PyInstaller is available")
         return True
-    except ImportError:
-        print("[ERROR] PyInstaller not found")
-        print("Installing PyInstaller...")
-        try:
-            subprocess.check_call([sys.executable, "-m", "pip", "install", "pyinstaller"])
-            print("[OK] PyInstaller installed successfully")
-            return True
-        except subprocess.CalledProcessError:
-            print("[ERROR] Failed to install PyInstaller")
-            return False
-
-def build_executable():
+    
+    # find_spec locates the package without running its __init__
+    if importlib.util.find_spec("PyInstaller") is not None:
+        print("[OK] PyInstaller is available")
+        _write_pyinstaller_sentinel()
+        return True
+    
+    print("[ERROR] PyInstaller not found")
+    print("Installing PyInstaller...")
+    try:
+        subprocess.check_call([sys.executable, "-m", "pip", "install",
+                               "--disable-pip-version-check", "--no-input",
+                               "--prefer-binary", "-q", "pyinstaller"])
+        print("[OK] PyInstaller installed successfully")
+        _write_pyinstaller_sentinel()
+        return True
+    except subprocess.CalledProcessError:
+        print("[ERROR] Failed to install PyInstaller")
+        return False
+
+def get_workpath():
+    """Get PyInstaller work directory for the current interpreter
+    
+    Keyed by interpreter path and version so switching virtualenvs does not
+    invalidate the cached analysis of another one.
+    """
+    return os.path.join("build", interpreter_key())
+
+def get_staged_src_dir():
+    """Build-owned copy of src/ holding the -OO .pyc files that get bundled"""
+    return os.path.join(get_workpath(), "src")
+
+def check_upx():
+    """Locate UPX for compressing the bundle, None if it is not installed"""
+    upx_name = "upx.exe" if os.name == "nt" else "upx"
+    if os.path.exists(os.path.join(UPX_DIR, upx_name)):
+        print(f"[OK] UPX found in {UPX_DIR}")
+        return UPX_DIR
+    
+    upx_path = shutil.which("upx")
+    if upx_path:
+        print(f"[OK] UPX found: {upx_path}")
+        return os.path.dirname(upx_path)
+    
+    print(f"! UPX not found (place it in {UPX_DIR} or on PATH), building without compression")
+    return None
+
+def source_hash(upx_dir=None):
+    """blake2b over everything that goes into the bundle"""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{interpreter_key()}|upx={bool(upx_dir)}|pyinstaller={_pyinstaller_version()}|"
+                  f"packages={_installed_packages_digest()}".encode('utf-8'))
+    
+    files = []
+    for dirpath, dirnames, filenames in os.walk("src"):
+        dirnames[:] = sorted(d for d in dirnames if d != "__pycache__")
+        files.extend(os.path.join(dirpath, f) for f in sorted(filenames) if f.endswith(".py"))
+    files.extend(f for f in BUILD_INPUTS if os.path.exists(f))
+    
+    for path in files:
+        digest.update(path.replace(os.sep, "/").encode('utf-8'))
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(64 * 1024), b''):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+def restore_cached_build(key):
+    """Copy a cached application folder into dist/, False on a cache miss"""
+    cached = os.path.join(BUILD_CACHE_DIR, key)
+    if not os.path.isdir(cached):
+        return False
+    
+    if os.path.exists(APP_DIR):
+        shutil.rmtree(APP_DIR)
+    shutil.copytree(cached, APP_DIR)
+    os.utime(cached)  # Mark as recently used for eviction
+    return True
+
+def store_cached_build(key):
+    """Save the freshly built application folder, keeping the newest entries"""
+    cached = os.path.join(BUILD_CACHE_DIR, key)
+    try:
+        if os.path.exists(cached):
+            shutil.rmtree(cached)
+        shutil.copytree(APP_DIR, cached)
+        os.utime(cached)  # copytree carries over the source folder's mtime
+        
+        entries = [entry for entry in os.scandir(BUILD_CACHE_DIR) if entry.is_dir()]
+        entries.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+        for entry in entries[MAX_CACHED_BUILDS:]:
+            shutil.rmtree(entry.path, ignore_errors=True)
+    except OSError as e:
+        print(f"! Could not cache build: {e}")
+
+def precompile_sources():
+    """Byte-compile a fresh copy of src/ at -OO into the staging directory
+    
+    The sources themselves are left alone, so no stale .pyc can outlive a
+    deleted or renamed module or be shipped by accident.
+    """
+    staged = get_staged_src_dir()
+    try:
+        # Earlier builds compiled in place, drop their leftovers so they can't shadow the sources
+        for dirpath, dirnames, filenames in os.walk("src"):
+            dirnames[:] = [d for d in dirnames if d != "__pycache__"]
+            for filename in filenames:
+                if filename.endswith(".pyc"):
+                    os.remove(os.path.join(dirpath, filename))
+        
+        if os.path.exists(staged):
+            shutil.rmtree(staged)
+        shutil.copytree("src", staged, ignore=shutil.ignore_patterns("__pycache__", "*.pyc", "*.pyo"))
+    except OSError as e:
+        print(f"[ERROR] Failed to stage src: {e}")
+        return False
+    
+    if compileall.compile_dir(staged, force=True, legacy=True, optimize=2, quiet=1):
+        print(f"[OK] Precompiled src with -OO into {staged}")
+        return True
+    print("[ERROR] Failed to precompile src")
+    return False
+
+def build_executable(force_clean=False, upx_dir=None):
     """Build the executable using PyInstaller"""
     print("Building executable...")
     
+    # Nothing that goes into the bundle changed, reuse the previous build
+    cache_key = source_hash(upx_dir)
+    if not force_clean and restore_cached_build(cache_key):
+        print(f"[OK] Sources unchanged, restored build from {BUILD_CACHE_DIR}")
+        return True
+    
+    # The spec file ships the staged .pyc files instead of the .py sources
+    if not precompile_sources():
+        return False
+    
     # Use spec file if it exists, otherwise use command line
-    spec_files = ["Shikimori Updater.spec", "shikimori_updater.spec"]
     spec_file = None
-    for spec in spec_files:
+    for spec in SPEC_FILES:
         if os.path.exists(spec):
             spec_file = spec
             break
@@ -41,8 +248,8 @@ def build_executable():
         print(f"Using spec file for build: {spec_file}")
         cmd = [
             "pyinstaller",
-            "--clean",     # Clean PyInstaller cache
             "--noconfirm", # Overwrite output directory
+            "--workpath", get_workpath(),
             spec_file
         ]
     else:
@@ -52,13 +259,17 @@ def build_executable():
             "pyinstaller",
             "--name", "Shikimori Updater",
             "--windowed",  # No console window
-            "--onefile",   # Single executable file
-            "--clean",     # Clean PyInstaller cache
+            "--onedir",    # Executable plus runtime folder, no per-launch extraction
+            "--optimize", "2",  # Strip docstrings and asserts, run the frozen app with -OO
             "--noconfirm", # Overwrite output directory
-            "--add-data", "src;src",  # Include src directory
+            "--workpath", get_workpath(),
+            "--add-data", f"{get_staged_src_dir()};src",  # Include the precompiled src directory
             "main.py"
         ]
         
+        for module in EXCLUDED_MODULES:
+            cmd.extend(["--exclude-module", module])
+        
         # Add icon files as data if they exist
         if os.path.exists("icon.png"):
             cmd.extend(["--add-data", "icon.png;."])
@@ -81,9 +292,22 @@ def build_executable():
             except Exception as e:
                 print(f"! Failed to convert icon: {e}")
     
+    # Compress binaries with UPX when available (spec file lists its own excludes)
+    if upx_dir:
+        cmd[1:1] = ["--upx-dir", upx_dir]
+        if not spec_file:
+            for dll in UPX_EXCLUDES:
+                cmd[1:1] = ["--upx-exclude", dll]
+    
+    # Routine rebuilds reuse PyInstaller's cached analysis in build/;
+    # --clean is only added when a from-scratch build is requested
+    if force_clean:
+        cmd.insert(1, "--clean")
+    
     try:
-        subprocess.check_call(cmd)
+        subprocess.check_call(cmd, env={**os.environ, STAGED_SRC_ENV: os.path.abspath(get_staged_src_dir())})
         print("[OK] Executable built successfully")
+        store_cached_build(cache_key)
         return True
     except subprocess.CalledProcessError as e:
         print(f"[ERROR] Build failed: {e}")
@@ -101,18 +325,39 @@ def copy_files():
         "requirements.txt"
     ]
     
-    for file in files_to_copy:
-        if os.path.exists(file):
-            try:
-                shutil.copy2(file, dist_dir)
-                print(f"[OK] Copied {file}")
-            except Exception as e:
-                print(f"[WARNING] Could not copy {file}: {e}")
+    for file, error in copy_files_parallel(files_to_copy, dist_dir):
+        if error:
+            print(f"[WARNING] Could not copy {file}: {error}")
+        else:
+            print(f"[OK] Copied {file}")
     
     return True
 
-def main():
+def copy_files_parallel(files, dest_dir, max_workers=4):
+    """Copy existing files into dest_dir on a thread pool
+    
+    Returns (file, error) pairs in input order, error is None on success.
+    Files that don't exist are skipped.
+    """
+    def copy_one(file):
+        try:
+            shutil.copy2(file, dest_dir)
+            return file, None
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            return file, e
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return [result for result in executor.map(copy_one, files) if result is not None]
+
+def main(argv=None):
     """Main build function"""
+    parser = argparse.ArgumentParser(description="Build Shikimori Updater executable")
+    parser.add_argument("--force-clean", action="store_true",
+                        help="Discard PyInstaller's cache and rebuild from scratch")
+    args = parser.parse_args(argv)
+    
     print("Shikimori Updater Build Script")
     print("=" * 40)
     
@@ -122,8 +367,11 @@ def main():
         print("pip install pyinstaller")
         return False
     
+    # Optional UPX compression
+    upx_dir = check_upx()
+    
     # Build executable
-    if not build_executable():
+    if not build_executable(force_clean=args.force_clean, upx_dir=upx_dir):
         print("\nBuild failed. Check the output above for errors.")
         return False
     
@@ -133,13 +381,14 @@ def main():
     print("\n" + "=" * 40)
     print("[SUCCESS] Build completed successfully!")
     
-    exe_path = os.path.join("dist", "Shikimori Updater.exe")
+    app_dir = APP_DIR
+    exe_path = os.path.join(app_dir, "Shikimori Updater.exe")
     if os.path.exists(exe_path):
-        size = os.path.getsize(exe_path) / (1024 * 1024)  # Size in MB
-        print(f"\nExecutable created: {exe_path}")
+        size = sum(f.stat().st_size for f in Path(app_dir).rglob('*') if f.is_file()) / (1024 * 1024)  # Size in MB
+        print(f"\nExecutable created: {app_dir}")
         print(f"Size: {size:.1f} MB")
-        print("\nYou can now distribute the 'dist' folder")
-        print("or just the executable file.")
+        print(f"\nYou can now distribute the '{app_dir}' folder.")
+        print("The executable needs the files next to it to run.")
     
     return True
 
@@ -4,29 +4,92 @@ Enhanced build script with version management and release automation
 """
 
 import os
+import re
 import sys
-import subprocess
+import argparse
+import hashlib
 import shutil
 import json
 import datetime
+import zipfile
 from pathlib import Path
 
+# build.py lives next to this script
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import build
+
+APP_DIR = os.path.join("dist", "Shikimori Updater")
+APP_EXE = os.path.join(APP_DIR, "Shikimori Updater.exe")
+VERSION_FILE = "src/utils/version.py"
+
+# Already-compressed payloads gain nothing from another deflate pass
+STORED_EXTENSIONS = {'.exe', '.zip', '.7z', '.upx'}
+
+_VERSION_RE = re.compile(r'__version__ = "[^"]*"')
+_BUILD_DATE_RE = re.compile(r'BUILD_DATE = "[^"]*"')
+_VERSION_READ_RE = re.compile(r'__version__ = "([^"]*)')
+
+def _walk_files(root):
+    """Yield every file below root as a scandir entry"""
+    with os.scandir(root) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _walk_files(entry.path)
+            elif entry.is_file():
+                yield entry
+
+def create_zip(zip_path, source_dir):
+    """Zip source_dir, storing already-compressed files as-is"""
+    with zipfile.ZipFile(zip_path, 'w', compression=zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
+        for entry in _walk_files(source_dir):
+            arcname = os.path.relpath(entry.path, source_dir)
+            if os.path.splitext(entry.name)[1].lower() in STORED_EXTENSIONS:
+                zf.write(entry.path, arcname, compress_type=zipfile.ZIP_STORED)
+            else:
+                zf.write(entry.path, arcname)
+
+def hash_app_dir(app_dir=APP_DIR):
+    """sha256 over the application folder, None if it was not built yet
+    
+    Covers the whole folder rather than just the exe, since src/ ships
+    as data next to it.
+    """
+    if not os.path.exists(app_dir):
+        return None
+    digest = hashlib.sha256()
+    for entry in sorted(_walk_files(app_dir), key=lambda e: e.path):
+        digest.update(os.path.relpath(entry.path, app_dir).encode('utf-8'))
+        with open(entry.path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+def read_current_version(version_file=VERSION_FILE):
+    """Read the version currently recorded in version.py"""
+    try:
+        with open(version_file, 'r', encoding='utf-8') as f:
+            version_match = _VERSION_READ_RE.search(f.read())
+        if version_match:
+            return version_match.group(1)
+    except OSError:
+        pass
+    return "1.0.0"
+
 def update_version(version_file, new_version):
     """Update version in version.py file"""
     try:
-        with open(version_file, 'r') as f:
-            content = f.read()
+        path = Path(version_file)
+        content = path.read_text(encoding='utf-8')
         
         # Update version
-        import re
-        content = re.sub(r'__version__ = "[^"]*"', f'__version__ = "{new_version}"', content)
+        new_content = _VERSION_RE.sub(f'__version__ = "{new_version}"', content)
         
         # Update build date
         today = datetime.date.today().strftime('%Y-%m-%d')
-        content = re.sub(r'BUILD_DATE = "[^"]*"', f'BUILD_DATE = "{today}"', content)
+        new_content = _BUILD_DATE_RE.sub(f'BUILD_DATE = "{today}"', new_content)
         
-        with open(version_file, 'w') as f:
-            f.write(content)
+        if new_content != content:
+            path.write_text(new_content, encoding='utf-8')
         
         print(f"Updated version to {new_version} and build date to {today}")
         return True
@@ -37,23 +100,30 @@ def update_version(version_file, new_version):
 def build_executable():
     """Build the executable"""
     try:
-        # Run the existing build script
-        result = subprocess.run([sys.executable, 'build.py'], 
-                              capture_output=True, text=True)
+        # Run the existing build script in this process, its output streams live
+        try:
+            ok = build.main([])
+        except SystemExit as e:
+            ok = e.code in (None, 0)
         
-        if result.returncode == 0:
+        if ok:
             print("Build successful!")
-            print(result.stdout)
-            return True
         else:
             print("Build failed!")
-            print(result.stderr)
-            return False
+        return bool(ok)
             
     except Exception as e:
         print(f"Error building executable: {e}")
         return False
 
+def _link_or_copy(src, dst):
+    """Hardlink src to dst, copying when linking isn't possible (e.g. across drives)"""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+    return dst
+
 def create_release_package(version, output_dir="releases"):
     """Create a release package"""
     try:
@@ -66,11 +136,14 @@ def create_release_package(version, output_dir="releases"):
             shutil.rmtree(version_dir)
         os.makedirs(version_dir)
         
-        # Copy executable
-        exe_path = os.path.join("dist", "Shikimori Updater.exe")
+        # Copy application folder (--onedir build: executable plus its runtime files).
+        # Files are hardlinked to dist/, so treat the version directory as read-only
+        app_dir = APP_DIR
+        exe_path = APP_EXE
         if os.path.exists(exe_path):
-            shutil.copy2(exe_path, version_dir)
-            print(f"Copied executable to {version_dir}")
+            shutil.copytree(app_dir, os.path.join(version_dir, "Shikimori Updater"),
+                            copy_function=_link_or_copy, dirs_exist_ok=True)
+            print(f"Copied application folder to {version_dir}")
         else:
             print(f"Executable not found at {exe_path}")
             return False
@@ -82,25 +155,25 @@ def create_release_package(version, output_dir="releases"):
             "CHANGELOG.md"  # If you have one
         ]
         
-        for file in files_to_copy:
-            if os.path.exists(file):
-                shutil.copy2(file, version_dir)
-                print(f"Copied {file}")
+        for file, error in build.copy_files_parallel(files_to_copy, version_dir):
+            if error:
+                raise error
+            print(f"Copied {file}")
         
         # Create release info
         release_info = {
             "version": version,
             "build_date": datetime.date.today().isoformat(),
-            "executable": "Shikimori Updater.exe",
-            "files": os.listdir(version_dir)
+            "executable": "Shikimori Updater/Shikimori Updater.exe",
+            "files": [entry.name for entry in os.scandir(version_dir)]
         }
         
-        with open(os.path.join(version_dir, "release_info.json"), 'w') as f:
+        with open(os.path.join(version_dir, "release_info.json"), 'w', encoding='utf-8') as f:
             json.dump(release_info, f, indent=2)
         
         # Create zip file
         zip_path = os.path.join(output_dir, f"ShikimoriUpdater-v{version}.zip")
-        shutil.make_archive(zip_path.replace('.zip', ''), 'zip', version_dir)
+        create_zip(zip_path, version_dir)
         
         print(f"Created release package: {zip_path}")
         return True
@@ -109,54 +182,62 @@ def create_release_package(version, output_dir="releases"):
         print(f"Error creating release package: {e}")
         return False
 
-def main():
+def main(argv=None):
     """Main build and release function"""
+    parser = argparse.ArgumentParser(description="Build a Shikimori Updater release")
+    parser.add_argument("version", nargs="?", help="Version to release (prompted if omitted)")
+    parser.add_argument("--rebuild", action="store_true",
+                        help="Rebuild the executable even if the version is unchanged")
+    args = parser.parse_args(argv)
+    
     print("Shikimori Updater Release Builder")
     print("=" * 40)
     
+    current_version = read_current_version()
+    
     # Get version from command line or prompt
-    if len(sys.argv) > 1:
-        new_version = sys.argv[1]
+    if args.version:
+        new_version = args.version
     else:
-        # Try to read current version
-        try:
-            with open('src/utils/version.py', 'r') as f:
-                content = f.read()
-                import re
-                version_match = re.search(r'__version__ = "([^"]*)', content)
-                if version_match:
-                    current_version = version_match.group(1)
-                else:
-                    current_version = "1.0.0"
-                print(f"Current version: {current_version}")
-        except:
-            current_version = "1.0.0"
-        
+        print(f"Current version: {current_version}")
         new_version = input(f"Enter new version (current: {current_version}): ").strip()
         if not new_version:
             new_version = current_version
     
     print(f"Building version: {new_version}")
     
-    # Update version file
-    version_file = "src/utils/version.py"
-    if not update_version(version_file, new_version):
-        print("Failed to update version file")
-        return False
+    zip_path = os.path.join("releases", f"ShikimoriUpdater-v{new_version}.zip")
+    rebuild = args.rebuild or new_version != current_version or not os.path.exists(APP_EXE)
     
-    # Build executable
-    if not build_executable():
-        print("Failed to build executable")
-        return False
+    if rebuild:
+        previous_hash = hash_app_dir()
+        
+        # Update version file
+        if not update_version(VERSION_FILE, new_version):
+            print("Failed to update version file")
+            return False
+        
+        # Build executable
+        if not build_executable():
+            print("Failed to build executable")
+            return False
+        
+        unchanged = previous_hash is not None and previous_hash == hash_app_dir()
+    else:
+        print("Version unchanged and executable present, skipping rebuild")
+        unchanged = False
     
     # Create release package
-    if not create_release_package(new_version):
+    if unchanged and os.path.exists(zip_path):
+        print(f"Build output is identical, reusing {zip_path}")
+    elif not create_release_package(new_version):
         print("Failed to create release package")
         return False
     
     print(f"\nBuild completed successfully!")
     print(f"Version: {new_version}")
     print(f"Release package created in: releases/")
+    return True
 
 if __name__ == "__main__":
     try:
@@ -5,11 +5,13 @@ Build script for the standalone updater executable
 
 import os
 import sys
-import subprocess
+import argparse
 import shutil
 from pathlib import Path
 
-def build_standalone_updater():
+from build import EXCLUDED_MODULES, UPX_EXCLUDES, check_upx
+
+def build_standalone_updater(force_clean=False):
     """Build the standalone updater executable using PyInstaller"""
     
     # Get the current directory
@@ -23,24 +25,41 @@ def build_standalone_updater():
     # Output directory
     dist_dir = current_dir / "dist"
     
-    # PyInstaller command
-    pyinstaller_cmd = [
-        sys.executable, "-m", "PyInstaller",
+    # PyInstaller arguments
+    pyinstaller_args = [
         "--onefile",
         "--console",
         "--name", "updater",
         "--distpath", str(dist_dir),
         "--workpath", str(current_dir / "build_updater"),
         "--specpath", str(current_dir),
-        "--clean",
-        str(updater_script)
     ]
     
+    # The updater is console-only, so Tk is not needed either
+    for module in EXCLUDED_MODULES + ["tkinter"]:
+        pyinstaller_args.extend(["--exclude-module", module])
+    
+    # Compress with UPX when available
+    upx_dir = check_upx()
+    if upx_dir:
+        pyinstaller_args.extend(["--upx-dir", upx_dir])
+        for dll in UPX_EXCLUDES:
+            pyinstaller_args.extend(["--upx-exclude", dll])
+    
+    pyinstaller_args.append(str(updater_script))
+    
+    # The stable --workpath above keeps PyInstaller's cache between runs;
+    # only wipe it when a from-scratch build is requested
+    if force_clean:
+        pyinstaller_args.insert(0, "--clean")
+    
     print("Building standalone updater...")
-    print(f"Command: {' '.join(pyinstaller_cmd)}")
+    print(f"Command: pyinstaller {' '.join(pyinstaller_args)}")
     
     try:
-        result = subprocess.run(pyinstaller_cmd, check=True, capture_output=True, text=True)
+        # Run PyInstaller in this process instead of spawning a new interpreter
+        import PyInstaller.__main__
+        PyInstaller.__main__.run(pyinstaller_args)
         print("Build completed successfully!")
         
         # Check if the executable was created
@@ -53,10 +72,8 @@ def build_standalone_updater():
             print("Error: Executable not found after build")
             return False
             
-    except subprocess.CalledProcessError as e:
-        print(f"Build failed with error: {e}")
-        print(f"stdout: {e.stdout}")
-        print(f"stderr: {e.stderr}")
+    except SystemExit as e:
+        print(f"Build failed with exit code: {e.code}")
         return False
     except Exception as e:
         print(f"Build failed with exception: {e}")
@@ -64,7 +81,12 @@ def build_standalone_updater():
 
 def main():
     """Main entry point"""
-    if not build_standalone_updater():
+    parser = argparse.ArgumentParser(description="Build the standalone updater executable")
+    parser.add_argument("--force-clean", action="store_true",
+                        help="Discard PyInstaller's cache and rebuild from scratch")
+    args = parser.parse_args()
+    
+    if not build_standalone_updater(force_clean=args.force_clean):
         sys.exit(1)
     
     print("\nStandalone updater built successfully!")
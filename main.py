@@ -4,77 +4,85 @@ Shikimori Updater - Main Application Entry Point
 Tracks anime episodes from media players and updates Shikimori list
 """
 
-import tkinter as tk
-from tkinter import ttk, messagebox
-import threading
 import sys
 import os
+import time
+import logging
 
 # Handle both development and PyInstaller environments
 def setup_path():
+    path_set = set(sys.path)
     if getattr(sys, 'frozen', False):
-        # Running as PyInstaller executable
+        # Running as PyInstaller executable, the bootloader already put _MEIPASS on sys.path
         application_path = sys._MEIPASS
-        src_path = os.path.join(application_path, 'src')
-        # Also add the main application path
-        if application_path not in sys.path:
-            sys.path.insert(0, application_path)
+        paths = (os.path.join(application_path, 'src'),)
     else:
-        # Running as script
+        # Running as script, add both the main directory and src directory
         application_path = os.path.dirname(os.path.abspath(__file__))
-        src_path = os.path.join(application_path, 'src')
-        # Add both the main directory and src directory
-        if application_path not in sys.path:
-            sys.path.insert(0, application_path)
+        paths = (application_path, os.path.join(application_path, 'src'))
     
-    if src_path not in sys.path:
-        sys.path.insert(0, src_path)
-    
-    # Debug path information (for development only)
-    # Uncomment for debugging path issues:
-    # print(f"Application path: {application_path}")
-    # print(f"Source path: {src_path}")
-    # print(f"Frozen: {getattr(sys, 'frozen', False)}")
-
-setup_path()
-
-# Initialize logging first
-try:
-    from utils.logger import get_logger
-    logger = get_logger('main')
-except ImportError as e:
-    print(f"Failed to import logger: {e}")
-    import logging
-    logging.basicConfig(level=logging.DEBUG)
-    logger = logging.getLogger('main')
-
-try:
-    from core.config import Config
-    from gui.main_window import MainWindow
-except ImportError as e:
-    logger.error(f"Failed to import main modules: {e}")
-    messagebox.showerror("Import Error", f"Failed to import required modules: {e}\n\nPlease check the installation.")
-    sys.exit(1)
+    for path in paths:
+        if path not in path_set:
+            sys.path.insert(0, path)
+            path_set.add(path)
+
+def _tk():
+    """Import Tk only once the application actually starts"""
+    import tkinter as tk
+    from tkinter import messagebox
+    return tk, messagebox
+
+def _get_logger():
+    """Initialize logging, falling back to basic logging if utils is unavailable"""
+    try:
+        from utils.logger import get_logger
+        return get_logger('main')
+    except ImportError as e:
+        print(f"Failed to import logger: {e}")
+        logging.basicConfig(level=logging.DEBUG)
+        return logging.getLogger('main')
 
 def main():
     """Main application entry point"""
+    setup_path()
+
+    # Initialize logging first
+    logger = _get_logger()
+
+    try:
+        from core.config import Config
+        from gui.main_window import MainWindow
+    except ImportError as e:
+        logger.error(f"Failed to import main modules: {e}")
+        _, messagebox = _tk()
+        messagebox.showerror("Import Error", f"Failed to import required modules: {e}\n\nPlease check the installation.")
+        sys.exit(1)
+
+    tk, messagebox = _tk()
+
     try:
-        # Test logging
         logger.info("Starting Shikimori Updater application")
-        
+        started = time.perf_counter()
+
         # Initialize configuration
         config = Config()
-        
+        config_done = time.perf_counter()
+
         # Create main window
         root = tk.Tk()
         photo = tk.PhotoImage(file = 'icon.png')
         root.wm_iconphoto(False, photo)
 
         app = MainWindow(root, config)
-        
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("startup: config=%.2fms, window=%.2fms",
+                         (config_done - started) * 1000,
+                         (time.perf_counter() - config_done) * 1000)
+
         # Start the application
         root.mainloop()
-        
+
     except Exception as e:
         messagebox.showerror("Error", f"Failed to start application: {str(e)}")
         sys.exit(1)
@@ -28,33 +28,52 @@ def check_python_version():
     print(f"✓ Python {version.major}.{version.minor}.{version.micro} is compatible")
     return True
 
+_wscript_shell = None
+
+def _get_wscript_shell():
+    """Return a shared WScript.Shell COM object, created on first use"""
+    global _wscript_shell
+    if _wscript_shell is None:
+        from win32com.client import Dispatch
+        _wscript_shell = Dispatch('WScript.Shell')
+    return _wscript_shell
+
+def _get_desktop_dir():
+    """Locate the user's desktop folder"""
+    try:
+        import winshell
+        return winshell.desktop()
+    except ImportError:
+        return os.path.join(os.path.expanduser("~"), "Desktop")
+
 def create_desktop_shortcut():
     """Create desktop shortcut (Windows only)"""
     if sys.platform != "win32":
         return
     
     try:
-        import winshell
-        from win32com.client import Dispatch
-        
-        desktop = winshell.desktop()
-        shortcut_path = os.path.join(desktop, "Shikimori Updater.lnk")
+        shortcut_path = os.path.join(_get_desktop_dir(), "Shikimori Updater.lnk")
         target = os.path.join(os.path.dirname(__file__), "main.py")
         working_dir = os.path.dirname(__file__)
         
-        shell = Dispatch('WScript.Shell')
-        shortcut = shell.CreateShortCut(shortcut_path)
-        shortcut.Targetpath = sys.executable
-        shortcut.Arguments = f'"{target}"'
-        shortcut.WorkingDirectory = working_dir
-        shortcut.IconLocation = sys.executable
-        shortcut.save()
+        try:
+            # Pure-Python .lnk writer, no COM round-trips
+            import pylnk3
+            pylnk3.for_file(sys.executable, shortcut_path, arguments=f'"{target}"',
+                            icon_file=sys.executable, work_dir=working_dir)
+        except ImportError:
+            shortcut = _get_wscript_shell().CreateShortCut(shortcut_path)
+            shortcut.Targetpath = sys.executable
+            shortcut.Arguments = f'"{target}"'
+            shortcut.WorkingDirectory = working_dir
+            shortcut.IconLocation = sys.executable
+            shortcut.save()
         
         print(f"✓ Desktop shortcut created: {shortcut_path}")
         
     except ImportError:
-        print("! Desktop shortcut creation requires 'winshell' package")
-        print("  You can install it with: pip install winshell pywin32")
+        print("! Desktop shortcut creation requires 'pylnk3' or 'pywin32' package")
+        print("  You can install it with: pip install pylnk3")
     except Exception as e:
         print(f"! Could not create desktop shortcut: {e}")
 
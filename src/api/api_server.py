@@ -3,158 +3,368 @@ HTTP API Server for Chrome Extension Integration
 Allows the Chrome extension to send anime scrobble data to the application
 """
 
-import json
+import socket
 import threading
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from concurrent.futures import ThreadPoolExecutor
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 from urllib.parse import urlparse, parse_qs
 import logging
-from typing import Callable, Optional, Dict, Any
+from typing import Callable, Optional, Dict, Any, List, Tuple
 
 from utils.logger import get_logger
+from utils import fast_json
+
+# Bodies of constant responses, serialized once at import
+_STATUS_BODY = fast_json.dumps({"status": "running", "message": "Shikimori Updater API is running"})
+_NOT_FOUND_BODY = fast_json.dumps({"status": "error", "message": "Not found"})
+_INVALID_JSON_BODY = fast_json.dumps({"status": "error", "message": "Invalid JSON data"})
+_MISSING_FIELDS_BODY = fast_json.dumps({"status": "error", "message": "Missing required fields: title, episode"})
+_FORBIDDEN_BODY = fast_json.dumps({"status": "error", "message": "Forbidden"})
+_TOO_LARGE_BODY = fast_json.dumps({"status": "error", "message": "Request body too large"})
+_QUEUED_BODY = fast_json.dumps({"status": "queued", "message": "Scrobble queued"})
+
+# Returned by the debouncing dispatcher when the callback will run later
+SCROBBLE_QUEUED = 'queued'
+
+# Constant response header lines
+_JSON_CONTENT_TYPE = b"Content-Type: application/json\r\n"
+_CONNECTION_KEEP_ALIVE = b"Connection: keep-alive\r\n"
+_CONNECTION_CLOSE = b"Connection: close\r\n"
+
+# Largest request body accepted, scrobble batches are a few KB at most
+MAX_BODY_SIZE = 1024 * 1024
 
 class AnimeScrobbleHandler(BaseHTTPRequestHandler):
     """HTTP request handler for anime scrobble requests"""
     
-    def __init__(self, *args, scrobble_callback: Optional[Callable] = None, shutdown_callback: Optional[Callable] = None, **kwargs):
-        self.scrobble_callback = scrobble_callback
-        self.shutdown_callback = shutdown_callback
-        self.logger = get_logger('api_server')
-        super().__init__(*args, **kwargs)
+    # Keep the extension's connection open between scrobbles
+    protocol_version = 'HTTP/1.1'
+    # Drop idle keep-alive connections instead of holding their thread forever
+    timeout = 30
+    # Small JSON replies go out immediately instead of waiting on Nagle
+    disable_nagle_algorithm = True
+    
+    # Preflight results are cached by the browser for a day, so scrobbles skip the OPTIONS round-trip
+    _PREFLIGHT_HEADERS = (
+        ('Access-Control-Allow-Methods', 'POST, GET, OPTIONS'),
+        ('Access-Control-Allow-Headers', 'Content-Type'),
+        ('Access-Control-Max-Age', '86400'),
+        ('Vary', 'Origin'),
+    )
+    _PREFLIGHT_HEADER_BLOCK = b''.join(f"{header}: {value}\r\n".encode('latin-1')
+                                       for header, value in _PREFLIGHT_HEADERS) + b"Content-Length: 0\r\n"
+    
+    # Browsers may only call the API from the extension (its id differs per unpacked install).
+    # Requests without an Origin come from local tools such as the updater and are allowed
+    _ALLOWED_ORIGIN_PREFIXES = ('chrome-extension://', 'moz-extension://')
+    
+    # path -> handler method name
+    _POST_ROUTES = {
+        '/api/scrobble': '_handle_scrobble',
+        '/api/cancel_scrobble': '_handle_cancel',
+        '/api/scrobble_batch': '_handle_batch',
+        '/api/shutdown': '_handle_shutdown',
+    }
+    _GET_ROUTES = {
+        '/api/status': '_handle_status',
+    }
+    
+    # Shared by all requests instead of being looked up per connection
+    logger = get_logger('api_server')
+    
+    # Longest a request waits for its scrobble callback
+    CALLBACK_TIMEOUT = 30
+    
+    # Set once per server on a subclass (see APIServer.start), not per request
+    scrobble_callback: Optional[Callable] = None
+    shutdown_callback: Optional[Callable] = None
+    executor: Optional[ThreadPoolExecutor] = None
+    
+    # Origin echoed in Access-Control-Allow-Origin for the current request
+    _cors_origin: Optional[str] = None
+    
+    def _check_origin(self) -> bool:
+        """Check the request's Origin against the whitelist"""
+        origin = self.headers.get('Origin')
+        if origin is None or origin.startswith(self._ALLOWED_ORIGIN_PREFIXES):
+            self._cors_origin = origin
+            return True
+        self._cors_origin = None
+        return False
     
     def do_OPTIONS(self):
         """Handle CORS preflight requests"""
+        if not self._check_origin():
+            self.send_prebuilt_response(403, _FORBIDDEN_BODY)
+            return
+        
         self.send_response(200)
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.send_header('Access-Control-Allow-Methods', 'POST, GET, OPTIONS')
-        self.send_header('Access-Control-Allow-Headers', 'Content-Type')
-        self.end_headers()
+        self.flush_headers()
+        self.wfile.write(self._cors_header() + self._PREFLIGHT_HEADER_BLOCK + b"\r\n")
     
     def do_POST(self):
         """Handle POST requests for scrobbling and cancelling"""
-        if self.path == '/api/scrobble':
-            try:
-                # Read the request body
-                content_length = int(self.headers['Content-Length'])
-                post_data = self.rfile.read(content_length)
-                
-                # Parse JSON data
-                anime_data = json.loads(post_data.decode('utf-8'))
-                
-                self.logger.info(f"Received scrobble request: {anime_data}")
-                
-                # Validate required fields
-                if not anime_data.get('title') or not anime_data.get('episode'):
-                    self.send_error_response(400, "Missing required fields: title, episode")
-                    return
-                
-                # Call the scrobble callback if provided
-                if self.scrobble_callback:
-                    try:
-                        result = self.scrobble_callback(anime_data)
-                        if result:
-                            self.send_success_response({"status": "success", "message": "Anime scrobbled successfully"})
-                        else:
-                            self.send_error_response(500, "Failed to scrobble anime")
-                    except Exception as e:
-                        self.logger.error(f"Error in scrobble callback: {e}")
-                        self.send_error_response(500, f"Internal error: {str(e)}")
-                else:
-                    self.send_success_response({"status": "received", "message": "Data received but no handler configured"})
-                    
-            except json.JSONDecodeError:
-                self.send_error_response(400, "Invalid JSON data")
-            except Exception as e:
-                self.logger.error(f"Error handling scrobble request: {e}")
-                self.send_error_response(500, f"Internal server error: {str(e)}")
-        elif self.path == '/api/cancel_scrobble':
-            try:
-                # Read the request body
-                content_length = int(self.headers['Content-Length'])
-                post_data = self.rfile.read(content_length)
-                
-                # Parse JSON data
-                cancel_data = json.loads(post_data.decode('utf-8'))
-                
-                self.logger.info(f"Received cancel scrobble request: {cancel_data}")
-                
-                # Call the scrobble callback with cancel action
-                if self.scrobble_callback:
-                    try:
-                        result = self.scrobble_callback({"action": "cancel", **cancel_data})
-                        if result:
-                            self.send_success_response({"status": "success", "message": "Scrobble cancelled successfully"})
-                        else:
-                            self.send_error_response(500, "Failed to cancel scrobble")
-                    except Exception as e:
-                        self.logger.error(f"Error in cancel scrobble callback: {e}")
-                        self.send_error_response(500, f"Internal error: {str(e)}")
-                else:
-                    self.send_success_response({"status": "received", "message": "Cancel request received but no handler configured"})
-                    
-            except json.JSONDecodeError:
-                self.send_error_response(400, "Invalid JSON data")
-            except Exception as e:
-                self.logger.error(f"Error handling cancel scrobble request: {e}")
-                self.send_error_response(500, f"Internal server error: {str(e)}")
-        elif self.path == '/api/shutdown':
-            try:
-                self.logger.info("Received shutdown request")
-                
-                # Call the shutdown callback if provided
-                if self.shutdown_callback:
-                    try:
-                        self.send_success_response({"status": "success", "message": "Shutdown initiated successfully"})
-                        # Call shutdown callback after sending response
-                        threading.Thread(target=self.shutdown_callback, daemon=True).start()
-                    except Exception as e:
-                        self.logger.error(f"Error in shutdown callback: {e}")
-                        self.send_error_response(500, f"Internal shutdown error: {str(e)}")
-                else:
-                    self.send_error_response(500, "Shutdown handler not configured")
-                    
-            except Exception as e:
-                self.logger.error(f"Error handling shutdown request: {e}")
-                self.send_error_response(500, f"Internal server error: {str(e)}")
+        self._body_read = False
+        # An unread body would be parsed as the next request on this connection
+        has_body = self.headers.get('Content-Length', '0') != '0'
+        
+        # Reject foreign origins before reading or parsing anything
+        if not self._check_origin():
+            self.close_connection = self.close_connection or has_body
+            self.send_prebuilt_response(403, _FORBIDDEN_BODY)
+            return
+        
+        if self._content_length() > MAX_BODY_SIZE:
+            self.close_connection = True
+            self.send_prebuilt_response(413, _TOO_LARGE_BODY)
+            return
+        
+        handler = self._POST_ROUTES.get(self.path)
+        if handler:
+            getattr(self, handler)()
         else:
-            self.send_error_response(404, "Not found")
+            self.close_connection = self.close_connection or has_body
+            self.send_prebuilt_response(404, _NOT_FOUND_BODY)
+        
+        if has_body and not self._body_read:
+            self.close_connection = True
+    
+    def _run_scrobble_callback(self, data: Dict[str, Any]):
+        """Run the scrobble callback on the server's bounded worker pool"""
+        if self.executor is None:
+            return self.scrobble_callback(data)
+        return self.executor.submit(self.scrobble_callback, data).result(timeout=self.CALLBACK_TIMEOUT)
+    
+    def _content_length(self) -> int:
+        """Declared request body size, 0 if missing or malformed"""
+        try:
+            return max(0, int(self.headers.get('Content-Length', 0)))
+        except ValueError:
+            return 0
+    
+    def _read_body(self) -> bytearray:
+        """Read the request body straight into a pre-sized buffer"""
+        content_length = self._content_length()
+        body = bytearray(content_length)
+        view = memoryview(body)
+        received = 0
+        while received < content_length:
+            count = self.rfile.readinto(view[received:])
+            if not count:
+                # Client closed early, parse what arrived
+                del view
+                del body[received:]
+                break
+            received += count
+        self._body_read = True
+        return body
+    
+    def _handle_scrobble(self):
+        """Handle a single scrobble"""
+        try:
+            # Read the request body
+            post_data = self._read_body()
+            
+            # Parse JSON data
+            anime_data = fast_json.loads(post_data)
+            
+            self.logger.info("Received scrobble request: %s", anime_data)
+            
+            # Validate required fields
+            if not anime_data.get('title') or not anime_data.get('episode'):
+                self.send_prebuilt_response(400, _MISSING_FIELDS_BODY)
+                return
+            
+            # Call the scrobble callback if provided
+            if self.scrobble_callback:
+                try:
+                    result = self._run_scrobble_callback(anime_data)
+                    if result == SCROBBLE_QUEUED:
+                        # The callback has not run yet, so don't claim success
+                        self.send_prebuilt_response(202, _QUEUED_BODY)
+                    elif result:
+                        self.send_success_response({"status": "success", "message": "Anime scrobbled successfully"})
+                    else:
+                        self.send_error_response(500, "Failed to scrobble anime")
+                except Exception as e:
+                    self.logger.error(f"Error in scrobble callback: {e}")
+                    self.send_error_response(500, f"Internal error: {str(e)}")
+            else:
+                self.send_success_response({"status": "received", "message": "Data received but no handler configured"})
+            
+        except fast_json.JSONDecodeError:
+            self.send_prebuilt_response(400, _INVALID_JSON_BODY)
+        except Exception as e:
+            self.logger.error(f"Error handling scrobble request: {e}")
+            self.send_error_response(500, f"Internal server error: {str(e)}")
+    
+    def _handle_cancel(self):
+        """Handle a scrobble cancellation"""
+        try:
+            # Read the request body
+            post_data = self._read_body()
+            
+            # Parse JSON data
+            cancel_data = fast_json.loads(post_data)
+            
+            self.logger.info("Received cancel scrobble request: %s", cancel_data)
+            
+            # Call the scrobble callback with cancel action
+            if self.scrobble_callback:
+                try:
+                    result = self._run_scrobble_callback({"action": "cancel", **cancel_data})
+                    if result:
+                        self.send_success_response({"status": "success", "message": "Scrobble cancelled successfully"})
+                    else:
+                        self.send_error_response(500, "Failed to cancel scrobble")
+                except Exception as e:
+                    self.logger.error(f"Error in cancel scrobble callback: {e}")
+                    self.send_error_response(500, f"Internal error: {str(e)}")
+            else:
+                self.send_success_response({"status": "received", "message": "Cancel request received but no handler configured"})
+            
+        except fast_json.JSONDecodeError:
+            self.send_prebuilt_response(400, _INVALID_JSON_BODY)
+        except Exception as e:
+            self.logger.error(f"Error handling cancel scrobble request: {e}")
+            self.send_error_response(500, f"Internal server error: {str(e)}")
+    
+    def _handle_batch(self):
+        """Handle several scrobbles sent in one request"""
+        try:
+            # Read the request body once for all events
+            post_data = self._read_body()
+            
+            batch_data = fast_json.loads(post_data)
+            events = batch_data.get('events') if isinstance(batch_data, dict) else None
+            if not isinstance(events, list):
+                self.send_error_response(400, "Missing required field: events")
+                return
+            
+            self.logger.info("Received scrobble batch with %d events", len(events))
+            
+            if not self.scrobble_callback:
+                self.send_success_response({"status": "received", "message": "Data received but no handler configured"})
+                return
+            
+            # Events are handed over in order and the dispatcher runs one title's events in sequence,
+            # so a later episode must not be overwritten by an earlier one
+            results = []
+            queued = False
+            for index, event in enumerate(events):
+                if not isinstance(event, dict) or not event.get('title') or not event.get('episode'):
+                    results.append({"index": index, "ok": False, "message": "Missing required fields: title, episode"})
+                    continue
+                try:
+                    result = self._run_scrobble_callback(event)
+                    if result == SCROBBLE_QUEUED:
+                        queued = True
+                        results.append({"index": index, "status": "queued"})
+                    else:
+                        results.append({"index": index, "ok": bool(result)})
+                except Exception as e:
+                    self.logger.error(f"Error in scrobble callback for batch event {index}: {e}")
+                    results.append({"index": index, "ok": False, "message": f"Internal error: {str(e)}"})
+            
+            if queued:
+                self.send_prebuilt_response(202, fast_json.dumps({"status": "queued", "results": results}))
+            else:
+                self.send_success_response({"status": "success", "results": results})
+            
+        except fast_json.JSONDecodeError:
+            self.send_prebuilt_response(400, _INVALID_JSON_BODY)
+        except Exception as e:
+            self.logger.error(f"Error handling scrobble batch request: {e}")
+            self.send_error_response(500, f"Internal server error: {str(e)}")
+    
+    def _handle_shutdown(self):
+        """Handle an application shutdown request"""
+        try:
+            self.logger.info("Received shutdown request")
+            
+            # Call the shutdown callback if provided
+            if self.shutdown_callback:
+                try:
+                    self.send_success_response({"status": "success", "message": "Shutdown initiated successfully"})
+                    # Call shutdown callback after sending response
+                    threading.Thread(target=self.shutdown_callback, daemon=True).start()
+                except Exception as e:
+                    self.logger.error(f"Error in shutdown callback: {e}")
+                    self.send_error_response(500, f"Internal shutdown error: {str(e)}")
+            else:
+                self.send_error_response(500, "Shutdown handler not configured")
+            
+        except Exception as e:
+            self.logger.error(f"Error handling shutdown request: {e}")
+            self.send_error_response(500, f"Internal server error: {str(e)}")
     
     def do_GET(self):
         """Handle GET requests for status check"""
-        if self.path == '/api/status':
-            self.send_success_response({"status": "running", "message": "Shikimori Updater API is running"})
+        self._check_origin()
+        handler = self._GET_ROUTES.get(self.path)
+        if handler:
+            getattr(self, handler)()
         else:
-            self.send_error_response(404, "Not found")
+            self.send_prebuilt_response(404, _NOT_FOUND_BODY)
+    
+    def _handle_status(self):
+        """Report that the API is up"""
+        self.send_prebuilt_response(200, _STATUS_BODY)
     
     def send_success_response(self, data: Dict[str, Any]):
         """Send a successful JSON response"""
-        self.send_response(200)
-        self.send_header('Content-Type', 'application/json')
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.end_headers()
-        self.wfile.write(json.dumps(data).encode('utf-8'))
+        self.send_prebuilt_response(200, fast_json.dumps(data))
     
     def send_error_response(self, status_code: int, message: str):
         """Send an error JSON response"""
-        self.send_response(status_code)
-        self.send_header('Content-Type', 'application/json')
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.end_headers()
         error_data = {"status": "error", "message": message}
-        self.wfile.write(json.dumps(error_data).encode('utf-8'))
+        self.send_prebuilt_response(status_code, fast_json.dumps(error_data))
+    
+    def _cors_header(self) -> bytes:
+        """Access-Control-Allow-Origin line for the current request, if any"""
+        if self._cors_origin:
+            return b"Access-Control-Allow-Origin: " + self._cors_origin.encode('latin-1') + b"\r\n"
+        return b""
+    
+    def send_prebuilt_response(self, status_code: int, body: bytes):
+        """Send an already serialized JSON response"""
+        # Status line, Server and Date come from send_response; the rest is one prebuilt block
+        self.send_response(status_code)
+        self.flush_headers()
+        connection = _CONNECTION_CLOSE if self.close_connection else _CONNECTION_KEEP_ALIVE
+        self.wfile.write(_JSON_CONTENT_TYPE + self._cors_header() + connection
+                         + b"Content-Length: " + str(len(body)).encode('ascii') + b"\r\n\r\n" + body)
     
     def log_message(self, format, *args):
         """Override to use our logger instead of stderr"""
-        self.logger.debug(f"{self.address_string()} - {format % args}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("%s - %s", self.address_string(), format % args)
+
+class FastHTTPServer(ThreadingHTTPServer):
+    """Threaded HTTP server tuned for small local JSON requests"""
+    
+    allow_reuse_address = True
+    
+    def server_bind(self):
+        super().server_bind()
+        self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
 
 class APIServer:
     """HTTP API Server for Chrome extension integration"""
     
+    # Scrobbles of one title within this window are collected, repeats of an episode folded into one
+    SCROBBLE_DEBOUNCE = 0.75
+    
     def __init__(self, port: int = 5000, scrobble_callback: Optional[Callable] = None, shutdown_callback: Optional[Callable] = None):
         self.port = port
         self.scrobble_callback = scrobble_callback
         self.shutdown_callback = shutdown_callback
         self.server = None
         self.server_thread = None
+        self._executor = None
+        self._pending: Dict[str, Tuple[threading.Timer, List[Dict[str, Any]]]] = {}  # title -> (timer, events)
+        self._running: Dict[str, List[Dict[str, Any]]] = {}  # title -> events that arrived while it runs
+        self._pending_lock = threading.Lock()
         self.logger = get_logger('api_server')
         self.running = False
     
@@ -165,11 +375,19 @@ class APIServer:
             return
         
         try:
-            # Create a custom handler class with the scrobble callback
-            def handler_factory(*args, **kwargs):
-                return AnimeScrobbleHandler(*args, scrobble_callback=self.scrobble_callback, shutdown_callback=self.shutdown_callback, **kwargs)
+            # Connections get a thread each, callbacks (which call Shikimori) share a bounded pool
+            self._executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix='api-callback')
+            
+            # Bind the callbacks on a handler subclass once, instead of building a handler per request
+            handler_class = type('BoundScrobbleHandler', (AnimeScrobbleHandler,), {
+                'scrobble_callback': staticmethod(self._dispatch_scrobble) if self.scrobble_callback else None,
+                'shutdown_callback': staticmethod(self.shutdown_callback) if self.shutdown_callback else None,
+                'executor': self._executor,
+            })
             
-            self.server = HTTPServer(('localhost', self.port), handler_factory)
+            # One thread per connection, so a slow callback doesn't stall other requests.
+            # Bind IPv4 loopback explicitly rather than whatever 'localhost' resolves to first
+            self.server = FastHTTPServer(('127.0.0.1', self.port), handler_class)
             self.server_thread = threading.Thread(target=self._run_server, daemon=True)
             self.server_thread.start()
             self.running = True
@@ -189,6 +407,15 @@ class APIServer:
                 self.server.shutdown()
                 self.server.server_close()
             
+            with self._pending_lock:
+                for timer, _events in self._pending.values():
+                    timer.cancel()
+                self._pending.clear()
+            
+            if self._executor:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+            
             if self.server_thread and self.server_thread.is_alive():
                 self.server_thread.join(timeout=2)
             
@@ -198,6 +425,89 @@ class APIServer:
         except Exception as e:
             self.logger.error(f"Error stopping API server: {e}")
     
+    def _dispatch_scrobble(self, data: Dict[str, Any]):
+        """Debounce scrobbles per title; cancels and manual scrobbles go through immediately"""
+        title = data.get('title')
+        if data.get('action') == 'cancel':
+            with self._pending_lock:
+                pending = self._pending.pop(title, None)
+            if pending:
+                pending[0].cancel()
+            return self.scrobble_callback(data)
+        
+        if data.get('manual'):
+            # The popup waits for the real result
+            return self.scrobble_callback(data)
+        
+        timer = threading.Timer(self.SCROBBLE_DEBOUNCE, self._fire_scrobble, args=(title,))
+        timer.daemon = True
+        with self._pending_lock:
+            previous, events = self._pending.pop(title, (None, []))
+            if previous:
+                previous.cancel()
+            # A repeat of a queued episode replaces it in place, other episodes keep their order
+            for i, event in enumerate(events):
+                if event.get('episode') == data.get('episode'):
+                    events[i] = data
+                    break
+            else:
+                events.append(data)
+            self._pending[title] = (timer, events)
+        timer.start()
+        return SCROBBLE_QUEUED
+    
+    def _fire_scrobble(self, title: str):
+        """Hand a title's collected scrobbles to the pool once the debounce window has passed"""
+        with self._pending_lock:
+            pending = self._pending.get(title)
+            if not pending or pending[0] is not threading.current_thread():
+                return
+            del self._pending[title]
+            events = pending[1]
+            if title in self._running:
+                # That title's worker picks these up when it finishes, keeping episodes in order
+                self._running[title].extend(events)
+                return
+            self._running[title] = []
+            executor = self._executor
+        
+        if executor:
+            try:
+                future = executor.submit(self._run_title_scrobbles, title, events)
+                future.add_done_callback(self._log_scrobble_future)
+                return
+            except RuntimeError:
+                # Pool already shut down, run in this timer thread instead
+                pass
+        self._run_title_scrobbles(title, events)
+    
+    def _run_title_scrobbles(self, title: str, events: List[Dict[str, Any]]):
+        """Run one title's scrobbles in order, including ones queued while running"""
+        try:
+            while True:
+                for event in events:
+                    try:
+                        if not self.scrobble_callback(event):
+                            self.logger.warning(f"Debounced scrobble failed: {title} episode {event.get('episode')}")
+                    except Exception as e:
+                        self.logger.error(f"Error in debounced scrobble callback for {title}: {e}", exc_info=True)
+                with self._pending_lock:
+                    events = self._running.get(title)
+                    if not events:
+                        # Checked and released under the lock, so nothing queued meanwhile is lost
+                        self._running.pop(title, None)
+                        return
+                    self._running[title] = []
+        except BaseException:
+            with self._pending_lock:
+                self._running.pop(title, None)
+            raise
+    
+    def _log_scrobble_future(self, future):
+        """Log anything that escaped a pooled scrobble run"""
+        if not future.cancelled() and future.exception():
+            self.logger.error(f"Debounced scrobble run failed: {future.exception()}")
+    
     def _run_server(self):
         """Run the server - called in separate thread"""
         try:
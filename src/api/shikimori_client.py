@@ -4,16 +4,45 @@ Handles authentication and API operations with Shikimori
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlencode
 from typing import Optional, Dict, Any, List
 
+from utils import fast_json
+from utils.logger import get_logger
+
+try:
+    # Streaming parser, lets list pages be parsed while they arrive
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
 class ShikimoriClient:
     """Client for Shikimori API operations"""
     
     BASE_URL = "https://shikimori.one/api"
     AUTH_URL = "https://shikimori.one/oauth"
     
+    logger = get_logger('shikimori_api')
+    
+    PAGE_LIMIT = 100  # Maximum items per page
+    PAGE_WORKERS = 4  # List pages kept in flight after the first one
+    DETAILS_CACHE_SIZE = 256  # Anime/manga detail responses kept for ETag revalidation
+    
+    # Adaptive rate limiting: additive increase on success, halve on 429
+    API_RATE_MIN = 0.5
+    API_RATE_MAX = 5.0
+    API_RATE_STEP = 0.1
+    RATE_LIMIT_RETRIES = 3
+    
+    REFRESH_REUSE_WINDOW = 5.0  # Seconds a fresh token is shared with queued 401 handlers
+    
     # Anime list statuses
     STATUSES = {
         'planned': 'Plan to Watch',
@@ -23,6 +52,8 @@ class ShikimoriClient:
         'rewatching': 'Rewatching',
         'on_hold': 'On Hold'
     }
+    STATUSES_INV = {display: key for key, display in STATUSES.items()}  # Display name -> status key
+    STATUS_DISPLAY_VALUES = tuple(STATUSES.values())  # Combobox values
     
     # Manga list statuses (no rewatching status for manga)
     # Note: Shikimori API uses 'watching' for currently reading manga
@@ -33,21 +64,44 @@ class ShikimoriClient:
         'dropped': 'Dropped',
         'on_hold': 'On Hold'
     }
+    MANGA_STATUSES_INV = {display: key for key, display in MANGA_STATUSES.items()}
+    MANGA_STATUS_DISPLAY_VALUES = tuple(MANGA_STATUSES.values())
     
     def __init__(self, config):
         self.config = config
         self.session = requests.Session()
         self.session.headers.update({
-            'User-Agent': 'ShikimoriUpdater/1.0'
+            'User-Agent': 'ShikimoriUpdater/1.0',
+            'Connection': 'keep-alive'
         })
         
-        # Setup logging
-        from utils.logger import get_logger
-        self.logger = get_logger('shikimori_api')
+        # Keep connections to shikimori.one alive between pages and retry
+        # transient failures with backoff (429 is handled by the rate limiter in _make_request).
+        # PATCH only sets absolute values so it is safe to repeat; POST (adding to the list) is not retried.
+        # A 5xx that outlasts the retries comes back as a response, so callers' status checks handle it
+        retry = Retry(total=3, backoff_factor=0.3, status_forcelist=[500, 502, 503, 504],
+                      allowed_methods=Retry.DEFAULT_ALLOWED_METHODS | {'PATCH'}, raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=retry)
+        self.session.mount('https://', adapter)
         
         # Rate limiting for API requests
-        self.api_request_delay = 0.5  # 500ms delay between requests to respect API limits
-        self.last_api_request = 0
+        # Token bucket: starts at 2 requests per second, up to 2 back-to-back.
+        # The rate adapts to the server (see _adapt_rate)
+        self.api_rate = 2.0
+        self.api_burst = 2.0
+        self._tokens = self.api_burst
+        self._token_ts = time.monotonic()
+        self._rate_lock = threading.Lock()
+        
+        # Concurrent 401s share a single refresh: whoever waited on the lock
+        # reuses a token obtained in the last REFRESH_REUSE_WINDOW seconds
+        self._last_refresh_ts = 0.0
+        self._token_lock = threading.Lock()
+        
+        # endpoint -> (etag, raw body bytes), least recently used first.
+        # Bytes are re-parsed on a hit so callers can't change what the next one gets
+        self._details_cache = OrderedDict()
+        self._details_lock = threading.Lock()
         
         # Set access token if available
         access_token = config.get('shikimori.access_token')
@@ -77,30 +131,44 @@ class ShikimoriClient:
             'redirect_uri': redirect_uri
         }
         
+        # Reuse the pooled session, but don't send the API bearer token to the token endpoint
         headers = {
-            'User-Agent': 'ShikimoriUpdater/1.0'
+            'Authorization': None
         }
         
-        response = requests.post(f"{self.AUTH_URL}/token", data=data, headers=headers)
+        response = self.session.post(f"{self.AUTH_URL}/token", data=data, headers=headers)
         
         if response.status_code == 200:
             token_data = response.json()
-            
-            # Save tokens to config
-            self.config.set('shikimori.access_token', token_data['access_token'])
-            self.config.set('shikimori.refresh_token', token_data['refresh_token'])
-            
-            # Update session headers
-            self.session.headers.update({
-                'Authorization': f'Bearer {token_data["access_token"]}'
-            })
-            
+            self._store_tokens(token_data)
             return token_data
         else:
             raise Exception(f"Failed to get access token: {response.status_code} - {response.text}")
     
+    def _store_tokens(self, token_data: Dict[str, Any]):
+        """Save new tokens to config and the session"""
+        self.config.set('shikimori.access_token', token_data['access_token'])
+        self.config.set('shikimori.refresh_token', token_data['refresh_token'])
+        # Persist the new pair right away, the old refresh token is no longer valid
+        self.config.flush()
+        
+        # Update session headers
+        self.session.headers.update({
+            'Authorization': f'Bearer {token_data["access_token"]}'
+        })
+        
+        self._last_refresh_ts = time.monotonic()
+    
     def refresh_access_token(self) -> bool:
         """Refresh access token using refresh token"""
+        # Callers that queued up behind a refresh reuse its result
+        with self._token_lock:
+            if time.monotonic() - self._last_refresh_ts < self.REFRESH_REUSE_WINDOW:
+                return True
+            return self._refresh_access_token()
+    
+    def _refresh_access_token(self) -> bool:
+        """Request a new access token, caller holds _token_lock"""
         refresh_token = self.config.get('shikimori.refresh_token')
         client_id = self.config.get('shikimori.client_id')
         client_secret = self.config.get('shikimori.client_secret')
@@ -115,25 +183,16 @@ class ShikimoriClient:
             'refresh_token': refresh_token
         }
         
+        # Reuse the pooled session, but don't send the API bearer token to the token endpoint
         headers = {
-            'User-Agent': 'ShikimoriUpdater/1.0'
+            'Authorization': None
         }
         
         try:
-            response = requests.post(f"{self.AUTH_URL}/token", data=data, headers=headers)
+            response = self.session.post(f"{self.AUTH_URL}/token", data=data, headers=headers)
             
             if response.status_code == 200:
-                token_data = response.json()
-                
-                # Update tokens
-                self.config.set('shikimori.access_token', token_data['access_token'])
-                self.config.set('shikimori.refresh_token', token_data['refresh_token'])
-                
-                # Update session headers
-                self.session.headers.update({
-                    'Authorization': f'Bearer {token_data["access_token"]}'
-                })
-                
+                self._store_tokens(response.json())
                 return True
             else:
                 return False
@@ -144,24 +203,158 @@ class ShikimoriClient:
         """Make authenticated request with automatic token refresh"""
         url = f"{self.BASE_URL}{endpoint}"
         
-        response = self.session.request(method, url, **kwargs)
+        for attempt in range(self.RATE_LIMIT_RETRIES + 1):
+            response = self.session.request(method, url, **kwargs)
+            
+            # If unauthorized, try to refresh token
+            if response.status_code == 401:
+                if self.refresh_access_token():
+                    response = self.session.request(method, url, **kwargs)
+            
+            self._adapt_rate(response)
+            if response.status_code != 429 or attempt == self.RATE_LIMIT_RETRIES:
+                return response
+            
+            # Rate limited: wait out the pause _adapt_rate put on the bucket, then retry
+            response.close()
+            self._wait_for_api_rate_limit()
+    
+    @staticmethod
+    def _header_seconds(response: requests.Response, name: str) -> Optional[float]:
+        """Numeric header value in seconds, None if missing or not a number"""
+        try:
+            return max(0.0, float(response.headers[name]))
+        except (KeyError, TypeError, ValueError):
+            return None
+    
+    def _adapt_rate(self, response: requests.Response):
+        """Adjust the request rate from the server's rate-limit feedback"""
+        status = response.status_code
+        pause = 0.0
+        if status == 429:
+            pause = self._header_seconds(response, 'Retry-After') or 1.0
         
-        # If unauthorized, try to refresh token
-        if response.status_code == 401:
-            if self.refresh_access_token():
-                response = self.session.request(method, url, **kwargs)
+        remaining = self._header_seconds(response, 'X-RateLimit-Remaining')
+        if remaining is not None and remaining < 2:
+            reset = self._header_seconds(response, 'X-RateLimit-Reset') or 0.0
+            # Either seconds until reset or an epoch timestamp
+            if reset > 1e9:
+                reset = max(0.0, reset - time.time())
+            pause = max(pause, reset)
         
-        return response
+        with self._rate_lock:
+            if status == 429:
+                self.api_rate = max(self.API_RATE_MIN, self.api_rate * 0.5)
+            elif status < 400:
+                self.api_rate = min(self.API_RATE_MAX, self.api_rate + self.API_RATE_STEP)
+            
+            if pause > 0:
+                # Put the bucket in debt so every caller waits out the pause
+                now = time.monotonic()
+                self._tokens = min(self.api_burst, self._tokens + (now - self._token_ts) * self.api_rate)
+                self._token_ts = now
+                self._tokens = min(self._tokens, 1.0 - pause * self.api_rate)
     
     def _wait_for_api_rate_limit(self):
         """Ensure we don't exceed API rate limits"""
-        current_time = time.time()
-        time_since_last = current_time - self.last_api_request
+        with self._rate_lock:
+            now = time.monotonic()
+            self._tokens = min(self.api_burst, self._tokens + (now - self._token_ts) * self.api_rate)
+            self._token_ts = now
+            # Take the token now; going negative reserves one that is still refilling
+            self._tokens -= 1
+            wait = -self._tokens / self.api_rate if self._tokens < 0 else 0
+        
+        if wait > 0:
+            time.sleep(wait)
+    
+    def _fetch_page(self, endpoint: str, page: int, params: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+        """Fetch a single list page, None if the request failed"""
+        self._wait_for_api_rate_limit()
+        
+        self.logger.debug("Fetching page %d of %s", page, endpoint)
+        response = self._make_request('GET', endpoint, params={**params, 'page': page, 'limit': self.PAGE_LIMIT},
+                                      stream=IJSON_AVAILABLE)
+        
+        try:
+            if response.status_code == 200:
+                if IJSON_AVAILABLE:
+                    # Let urllib3 undo gzip so ijson reads plain JSON off the socket
+                    response.raw.decode_content = True
+                    return list(ijson.items(response.raw, 'item', use_float=True))
+                return fast_json.loads(response.content)
+            
+            self.logger.error(f"Failed to fetch page {page} of {endpoint}: HTTP {response.status_code}")
+            return None
+        finally:
+            response.close()
+    
+    def _iter_pages(self, endpoint: str, status: str = None):
+        """Yield the pages of a user list, keeping the next pages in flight meanwhile"""
+        params = {'status': status} if status else {}
+        
+        first_page = self._fetch_page(endpoint, 1, params)
+        if not first_page:
+            return
+        yield first_page
+        # If we got less than the limit, this was the last page
+        if len(first_page) < self.PAGE_LIMIT:
+            return
         
-        if time_since_last < self.api_request_delay:
-            time.sleep(self.api_request_delay - time_since_last)
+        with ThreadPoolExecutor(max_workers=self.PAGE_WORKERS) as executor:
+            in_flight = deque(executor.submit(self._fetch_page, endpoint, p, params)
+                              for p in range(2, 2 + self.PAGE_WORKERS))
+            next_page = 2 + self.PAGE_WORKERS
+            try:
+                while in_flight:
+                    # Pages come back in order; stop at the first failed, empty or short one
+                    page_data = in_flight.popleft().result()
+                    if not page_data:
+                        return
+                    if len(page_data) == self.PAGE_LIMIT:
+                        in_flight.append(executor.submit(self._fetch_page, endpoint, next_page, params))
+                        next_page += 1
+                    yield page_data
+                    if len(page_data) < self.PAGE_LIMIT:
+                        return
+            finally:
+                for future in in_flight:
+                    future.cancel()
+    
+    def _fetch_all_pages(self, endpoint: str, status: str = None) -> List[Dict[str, Any]]:
+        """Fetch every page of a user list"""
+        items = []
+        for page_data in self._iter_pages(endpoint, status):
+            items.extend(page_data)
+            self.logger.debug("Fetched %d items, total: %d", len(page_data), len(items))
+        return items
+    
+    def _get_details(self, endpoint: str) -> Optional[Dict[str, Any]]:
+        """GET a details endpoint, revalidating a cached copy with If-None-Match"""
+        with self._details_lock:
+            cached = self._details_cache.get(endpoint)
+        
+        headers = {'If-None-Match': cached[0]} if cached else None
+        response = self._make_request('GET', endpoint, headers=headers)
+        
+        if response.status_code == 304 and cached:
+            with self._details_lock:
+                if endpoint in self._details_cache:
+                    self._details_cache.move_to_end(endpoint)
+            return fast_json.loads(cached[1])
+        if response.status_code != 200:
+            return None
         
-        self.last_api_request = time.time()
+        content = response.content
+        body = fast_json.loads(content)
+        etag = response.headers.get('ETag')
+        if etag:
+            with self._details_lock:
+                self._details_cache[endpoint] = (etag, content)
+                self._details_cache.move_to_end(endpoint)
+                while len(self._details_cache) > self.DETAILS_CACHE_SIZE:
+                    self._details_cache.popitem(last=False)
+        return body
     
     def get_current_user(self) -> Optional[Dict[str, Any]]:
         """Get current authenticated user info"""
@@ -187,44 +380,8 @@ class ShikimoriClient:
         status_filter = f" with status '{status}'" if status else ""
         self.logger.info(f"Fetching anime list for user {user_id}{status_filter}")
         
-        all_anime = []
-        page = 1
-        limit = 100  # Maximum items per page
-        
         try:
-            while True:
-                # Rate limiting - wait before making request
-                self._wait_for_api_rate_limit()
-                
-                params = {
-                    'page': page,
-                    'limit': limit
-                }
-                if status:
-                    params['status'] = status
-
-                self.logger.debug(f"Fetching page {page} of anime list")
-                response = self._make_request('GET', f'/users/{user_id}/anime_rates', params=params)
-
-                if response.status_code == 200:
-                    page_data = response.json()
-
-                    # If no data returned, we've reached the end
-                    if not page_data:
-                        break
-
-                    all_anime.extend(page_data)
-                    self.logger.debug(f"Fetched {len(page_data)} anime from page {page}, total: {len(all_anime)}")
-
-                    # If we got less than the limit, this was the last page
-                    if len(page_data) < limit:
-                        break
-
-                    page += 1
-                else:
-                    self.logger.error(f"Failed to fetch anime list page {page}: HTTP {response.status_code}")
-                    break
-
+            all_anime = self._fetch_all_pages(f'/users/{user_id}/anime_rates', status)
             self.logger.info(f"Successfully fetched {len(all_anime)} anime{status_filter}")
             return all_anime
         except Exception as e:
@@ -234,10 +391,7 @@ class ShikimoriClient:
     def get_anime_details(self, anime_id: int) -> Optional[Dict[str, Any]]:
         """Get detailed anime information"""
         try:
-            response = self._make_request('GET', f'/animes/{anime_id}')
-            if response.status_code == 200:
-                return response.json()
-            return None
+            return self._get_details(f'/animes/{anime_id}')
         except Exception:
             return None
     
@@ -328,41 +482,8 @@ class ShikimoriClient:
     # Manga methods
     def get_user_manga_list(self, user_id: int, status: str = None) -> List[Dict[str, Any]]:
         """Get user's manga list with pagination support"""
-        all_manga = []
-        page = 1
-        limit = 100  # Maximum items per page
-        
         try:
-            while True:
-                # Rate limiting - wait before making request
-                self._wait_for_api_rate_limit()
-                
-                params = {
-                    'page': page,
-                    'limit': limit
-                }
-                if status:
-                    params['status'] = status
-
-                response = self._make_request('GET', f'/users/{user_id}/manga_rates', params=params)
-
-                if response.status_code == 200:
-                    page_data = response.json()
-
-                    # If no data returned, we've reached the end
-                    if not page_data:
-                        break
-
-                    all_manga.extend(page_data)
-
-                    # If we got less than the limit, this was the last page
-                    if len(page_data) < limit:
-                        break
-
-                    page += 1
-                else:
-                    break
-
+            all_manga = self._fetch_all_pages(f'/users/{user_id}/manga_rates', status)
             return all_manga
         except Exception as e:
             return []
@@ -370,10 +491,7 @@ class ShikimoriClient:
     def get_manga_details(self, manga_id: int) -> Optional[Dict[str, Any]]:
         """Get detailed manga information"""
         try:
-            response = self._make_request('GET', f'/mangas/{manga_id}')
-            if response.status_code == 200:
-                return response.json()
-            return None
+            return self._get_details(f'/mangas/{manga_id}')
         except Exception:
             return None
     
@@ -3,19 +3,76 @@ Cache Manager for Shikimori Updater
 Handles caching anime list data to disk for faster startup
 """
 
-import json
 import os
 import time
-from typing import Dict, List, Any, Optional
+import queue
+import atexit
+import threading
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
+from utils import fast_json
+from utils.logger import get_logger
+from api.shikimori_client import ShikimoriClient
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+try:
+    # Keeps the int keys of the detailed info cache without a conversion pass
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+try:
+    import zstandard as zstd
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+# List caches are zstd-compressed JSON when zstandard is installed
+LIST_CACHE_EXT = '.json.zst' if ZSTD_AVAILABLE else '.json'
+
+# Status buckets a list cache may hold
+VALID_STATUSES = frozenset(ShikimoriClient.STATUSES)
+VALID_MANGA_STATUSES = frozenset(ShikimoriClient.MANGA_STATUSES)
 
 class CacheManager:
     """Manages caching of anime list data"""
     
+    PRETTY_JSON = False  # Indent cache files, only useful when inspecting them by hand
+    FLUSH_DELAY = 0.5  # Seconds to coalesce list mutations before writing them to disk
+    RETRY_DELAY = 5.0  # Seconds before a failed flush or disk write is tried again
+    
     def __init__(self, config):
         self.config = config
+        self.logger = get_logger('cache')
         self.cache_dir = self._get_cache_dir()
         self._ensure_cache_dir()
+        
+        # Parsed list caches by file path; mutations write through to these and
+        # are flushed to disk in one go after FLUSH_DELAY
+        self._mem: Dict[str, Dict[str, Any]] = {}
+        # Per path: entry id -> (status key, position in that status list)
+        self._index: Dict[str, Dict[int, Tuple[str, int]]] = {}
+        self._dirty = set()
+        self._lock = threading.RLock()
+        self._flush_timer = None
+        
+        # (file name prefix, user id, extension) -> path
+        self._path_cache: Dict[Tuple[str, int, str], str] = {}
+        
+        # Disk writes happen on one background thread; a path queued twice is
+        # written once with the newest data
+        self._pending: Dict[str, Tuple[bytes, Optional[str]]] = {}
+        self._writing = None
+        self._write_lock = threading.Lock()
+        self._write_queue = queue.Queue()
+        threading.Thread(target=self._writer, name='CacheWriter', daemon=True).start()
+        atexit.register(self.flush)
     
     def _get_cache_dir(self) -> str:
         """Get cache directory path"""
@@ -32,9 +89,288 @@ class CacheManager:
         """Ensure cache directory exists"""
         os.makedirs(self.cache_dir, exist_ok=True)
     
+    def _cache_path(self, prefix: str, user_id: int, ext: str = '') -> str:
+        """Cache file path for a user, memoized"""
+        key = (prefix, user_id, ext)
+        path = self._path_cache.get(key)
+        if path is None:
+            path = self._path_cache[key] = os.path.join(self.cache_dir, f"{prefix}_{user_id}{ext}")
+        return path
+    
+    def _read_json(self, path: str) -> Any:
+        """Load a JSON cache file, decompressing .zst files"""
+        self._wait_for_write(path)
+        with open(path, 'rb') as f:
+            data = f.read()
+        if path.endswith('.zst'):
+            data = zstd.ZstdDecompressor().decompress(data)
+        return fast_json.loads(data)
+    
+    def _atomic_write_json(self, path: str, obj: Any):
+        """Serialize obj now and queue it to be written over path"""
+        self._atomic_write(path, fast_json.dumps(obj, indent=self.PRETTY_JSON))
+    
+    def _atomic_write(self, path: str, data: bytes, obsolete: Optional[str] = None):
+        """Queue data to be written over path, then obsolete removed, by the writer thread"""
+        with self._write_lock:
+            queued = path in self._pending
+            self._pending[path] = (data, obsolete)
+        if not queued:
+            self._write_queue.put(path)
+    
+    def _writer(self):
+        """Write queued cache files one at a time"""
+        while True:
+            path = self._write_queue.get()
+            item = None
+            try:
+                with self._write_lock:
+                    item = self._pending.pop(path, None)
+                    self._writing = path
+                if item is not None:
+                    data, obsolete = item
+                    temp_file = path + '.tmp'
+                    with open(temp_file, 'wb') as f:
+                        f.write(data)
+                    
+                    # Atomic on both POSIX and Windows, readers never see a missing file
+                    os.replace(temp_file, path)
+                    if obsolete and os.path.exists(obsolete):
+                        os.remove(obsolete)
+            except Exception as e:
+                self.logger.error(f"Error writing cache {path}, retrying in {self.RETRY_DELAY:.0f}s: {e}")
+                if item is not None:
+                    self._retry_write(path, item)
+            finally:
+                with self._write_lock:
+                    self._writing = None
+                self._write_queue.task_done()
+    
+    def _retry_write(self, path: str, item: Tuple[bytes, Optional[str]]):
+        """Queue a failed write again later, unless newer data for path is already queued"""
+        with self._write_lock:
+            if path in self._pending:
+                return
+            self._pending[path] = item
+        timer = threading.Timer(self.RETRY_DELAY, self._write_queue.put, args=(path,))
+        timer.daemon = True
+        timer.start()
+    
+    def _wait_for_write(self, *paths: str):
+        """Block until queued writes to any of paths have reached the disk"""
+        with self._write_lock:
+            busy = any(path in self._pending or path == self._writing for path in paths)
+        if busy:
+            self._write_queue.join()
+    
+    def _meta_path(self, path: str) -> str:
+        """Sidecar file holding the header of a list cache"""
+        return path[:-len(LIST_CACHE_EXT)] + '.meta.json'
+    
+    def _legacy_path(self, path: str) -> Optional[str]:
+        """Uncompressed cache written before zstandard was installed"""
+        if path.endswith('.zst'):
+            return path[:-len('.zst')]
+        return None
+    
+    def _write_list_cache(self, path: str, cache_data: Dict[str, Any]):
+        """Write a list cache and its metadata sidecar"""
+        data = fast_json.dumps(cache_data, indent=self.PRETTY_JSON)
+        if path.endswith('.zst'):
+            data = zstd.ZstdCompressor(level=3).compress(data)
+        # Drop the uncompressed copy so it cannot shadow newer data if zstandard goes away
+        self._atomic_write(path, data, obsolete=self._legacy_path(path))
+        self._atomic_write_json(self._meta_path(path), {
+            'user_id': cache_data.get('user_id'),
+            'timestamp': cache_data.get('timestamp', 0),
+            'datetime': cache_data.get('datetime'),
+            'status_counts': {status: len(entries) for status, entries in cache_data.get('data', {}).items()}
+        })
+    
+    def _read_cache_meta(self, path: str) -> Optional[Dict[str, Any]]:
+        """Get user_id/timestamp of a list cache without parsing its entries"""
+        with self._lock:
+            cache_data = self._mem.get(path)
+            if cache_data is not None:
+                return {'user_id': cache_data.get('user_id'), 'timestamp': cache_data.get('timestamp', 0)}
+        
+        self._wait_for_write(path)
+        if not os.path.exists(path):
+            # Nothing or only an uncompressed legacy cache
+            return self._load_cache_data(path)
+        
+        meta_file = self._meta_path(path)
+        if os.path.exists(meta_file) and os.path.getmtime(meta_file) >= os.path.getmtime(path):
+            return self._read_json(meta_file)
+        
+        if IJSON_AVAILABLE:
+            # user_id and timestamp are written before the entries, stop at the first two keys
+            meta = {}
+            with open(path, 'rb') as raw:
+                f = zstd.ZstdDecompressor().stream_reader(raw) if path.endswith('.zst') else raw
+                for key, value in ijson.kvitems(f, '', use_float=True):
+                    if key == 'data':
+                        break
+                    meta[key] = value
+                    if 'user_id' in meta and 'timestamp' in meta:
+                        break
+            return meta
+        
+        return self._load_cache_data(path)
+    
+    def _load_cache_data(self, path: str) -> Optional[Dict[str, Any]]:
+        """Get the parsed list cache for path, reading the file only on first use"""
+        with self._lock:
+            cache_data = self._mem.get(path)
+            if cache_data is None:
+                self._wait_for_write(path)
+                source = path
+                if not os.path.exists(source):
+                    # Pick up an uncompressed cache once, the next write converts it
+                    source = self._legacy_path(path)
+                    if not source or not os.path.exists(source):
+                        return None
+                cache_data = self._read_json(source)
+                self._mem[path] = cache_data
+            return cache_data
+    
+    def _store_cache_data(self, path: str, cache_data: Dict[str, Any]):
+        """Replace the list cache for path and write it immediately"""
+        with self._lock:
+            self._mem[path] = cache_data
+            self._index.pop(path, None)
+            self._dirty.discard(path)
+            self._write_list_cache(path, cache_data)
+    
+    def _mark_dirty(self, path: str, cache_data: Dict[str, Any]):
+        """Record an in-memory mutation and schedule a coalesced flush"""
+        with self._lock:
+            # Update timestamp to mark cache as recently modified
+            cache_data['timestamp'] = time.time()
+            cache_data['datetime'] = datetime.now().isoformat()
+            self._dirty.add(path)
+            self._schedule_flush(self.FLUSH_DELAY)
+    
+    def _schedule_flush(self, delay: float):
+        """Arm the flush timer unless one is already waiting (caller holds self._lock)"""
+        if self._flush_timer is None:
+            self._flush_timer = threading.Timer(delay, self._flush_dirty)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+    
+    def _copy_list_data(self, list_data: Optional[Dict[str, List[Dict[str, Any]]]]):
+        """Copy status lists and their entries going into or out of the in-memory cache
+        
+        Callers mutate what they get on their own threads, the cache's copy
+        only changes under self._lock, so _flush_dirty serializes a stable snapshot.
+        """
+        if list_data is None:
+            return None
+        with self._lock:
+            return {status: [dict(entry) for entry in entries] for status, entries in list_data.items()}
+    
+    def _forget(self, path: str):
+        """Drop the in-memory copy of a list cache and any pending write for it"""
+        with self._lock:
+            self._mem.pop(path, None)
+            self._index.pop(path, None)
+            self._dirty.discard(path)
+        with self._write_lock:
+            self._pending.pop(path, None)
+            self._pending.pop(self._meta_path(path), None)
+        # Let a write that is already running finish before the caller deletes files
+        self._wait_for_write(path, self._meta_path(path))
+    
+    def _build_index(self, path: str, list_data: Dict[str, List[Dict[str, Any]]]) -> Dict[int, Tuple[str, int]]:
+        """Index every entry of a list cache by id"""
+        index = {entry.get('id'): (status, i)
+                 for status, entries in list_data.items()
+                 for i, entry in enumerate(entries)}
+        self._index[path] = index
+        return index
+    
+    def _reindex_status(self, path: str, list_data: Dict[str, List[Dict[str, Any]]], status: str):
+        """Refresh index positions for one status list after it changed"""
+        index = self._index[path]
+        for i, entry in enumerate(list_data[status]):
+            index[entry.get('id')] = (status, i)
+    
+    def _locate_entry(self, path: str, list_data: Dict[str, List[Dict[str, Any]]], entry_id: int) -> Optional[Tuple[str, int]]:
+        """Find (status, position) of an entry, rebuilding a stale index once"""
+        index = self._index.get(path)
+        if index is None:
+            index = self._build_index(path, list_data)
+        
+        location = index.get(entry_id)
+        if location is not None:
+            status, i = location
+            entries = list_data.get(status)
+            if entries is not None and i < len(entries) and entries[i].get('id') == entry_id:
+                return location
+        
+        # The lists were changed from outside (e.g. the UI holds the same dicts)
+        return self._build_index(path, list_data).get(entry_id)
+    
+    def _append_entry(self, path: str, list_data: Dict[str, List[Dict[str, Any]]], status: str, entry: Dict[str, Any]):
+        """Append an entry to a status list and index it"""
+        entries = list_data.setdefault(status, [])
+        entries.append(entry)
+        if path in self._index:
+            self._index[path][entry.get('id')] = (status, len(entries) - 1)
+    
+    def _update_entry(self, path: str, list_data: Dict[str, List[Dict[str, Any]]], entry_id: int, updates: Dict[str, Any]) -> bool:
+        """Apply updates to an entry, moving it if its status changes"""
+        location = self._locate_entry(path, list_data, entry_id)
+        if location is None:
+            return False
+        
+        status_key, i = location
+        entry = list_data[status_key][i]
+        
+        # Check if status is changing (need to move between lists)
+        old_status = entry.get('status', '')
+        new_status = updates.get('status', old_status)
+        
+        entry.update(updates)
+        if new_status != old_status:
+            # Move to the new status list, positions after i shift down by one
+            list_data[status_key].pop(i)
+            self._reindex_status(path, list_data, status_key)
+            self._append_entry(path, list_data, new_status, entry)
+        return True
+    
+    def flush(self):
+        """Write all pending cache changes to disk and wait for them"""
+        self._flush_dirty()
+        self._write_queue.join()
+    
+    def _flush_dirty(self):
+        """Queue writes for all list caches mutated in memory"""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            
+            failed = []
+            while self._dirty:
+                path = self._dirty.pop()
+                if path not in self._mem:
+                    continue
+                try:
+                    # Serialized to bytes here under the lock, the writer thread never sees the dicts
+                    self._write_list_cache(path, self._mem[path])
+                except Exception as e:
+                    self.logger.error(f"Error flushing cache {path}, retrying in {self.RETRY_DELAY:.0f}s: {e}")
+                    failed.append(path)
+            
+            # Keep failed mutations dirty so they are not lost from disk
+            if failed:
+                self._dirty.update(failed)
+                self._schedule_flush(self.RETRY_DELAY)
+    
     def _get_cache_file_path(self, user_id: int) -> str:
         """Get cache file path for specific user"""
-        return os.path.join(self.cache_dir, f"anime_list_{user_id}.json")
+        return self._cache_path('anime_list', user_id, LIST_CACHE_EXT)
     
     def save_anime_list(self, user_id: int, anime_list_data: Dict[str, List[Dict[str, Any]]]):
         """Save anime list data to cache"""
@@ -45,18 +381,10 @@ class CacheManager:
                 'user_id': user_id,
                 'timestamp': time.time(),
                 'datetime': datetime.now().isoformat(),
-                'data': anime_list_data
+                'data': self._copy_list_data(anime_list_data)
             }
             
-            # Write to temporary file first, then rename for atomic operation
-            temp_file = cache_file + '.tmp'
-            with open(temp_file, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, ensure_ascii=False, indent=2)
-            
-            # Atomic rename
-            if os.path.exists(cache_file):
-                os.remove(cache_file)
-            os.rename(temp_file, cache_file)
+            self._store_cache_data(cache_file, cache_data)
             
             print(f"Cache saved: {cache_file}")
             return True
@@ -70,20 +398,18 @@ class CacheManager:
         try:
             cache_file = self._get_cache_file_path(user_id)
             
-            if not os.path.exists(cache_file):
+            cache_data = self._load_cache_data(cache_file)
+            if cache_data is None:
                 print("No cache file found")
                 return None
             
-            with open(cache_file, 'r', encoding='utf-8') as f:
-                cache_data = json.load(f)
-            
             # Verify cache is for correct user
             if cache_data.get('user_id') != user_id:
                 print("Cache user ID mismatch")
                 return None
             
             print(f"Cache loaded from: {cache_data.get('datetime', 'unknown time')}")
-            return cache_data.get('data')
+            return self._copy_list_data(cache_data.get('data'))
         
         except Exception as e:
             print(f"Error loading cache: {e}")
@@ -94,14 +420,12 @@ class CacheManager:
         try:
             cache_file = self._get_cache_file_path(user_id)
             
-            if not os.path.exists(cache_file):
+            # Mutations are applied to the in-memory copy
+            cache_data = self._load_cache_data(cache_file)
+            if cache_data is None:
                 print("No cache file found to add anime to")
                 return False
             
-            # Load current cache
-            with open(cache_file, 'r', encoding='utf-8') as f:
-                cache_data = json.load(f)
-            
             # Verify cache is for correct user
             if cache_data.get('user_id') != user_id:
                 print("Cache user ID mismatch")
@@ -109,28 +433,16 @@ class CacheManager:
             
             # Get the status to add the anime to
             status = anime_entry.get('status', 'planned')
+            if status not in VALID_STATUSES:
+                print(f"Unknown status '{status}' for anime ID {anime_entry.get('id')}")
+                return False
             anime_list_data = cache_data.get('data', {})
             
-            # Make sure the status list exists
-            if status not in anime_list_data:
-                anime_list_data[status] = []
-            
             # Add the new anime entry
-            anime_list_data[status].append(anime_entry)
+            with self._lock:
+                self._append_entry(cache_file, anime_list_data, status, dict(anime_entry))
             
-            # Update timestamp to mark cache as recently modified
-            cache_data['timestamp'] = time.time()
-            cache_data['datetime'] = datetime.now().isoformat()
-            
-            # Write back to cache file
-            temp_file = cache_file + '.tmp'
-            with open(temp_file, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, ensure_ascii=False, indent=2)
-            
-            # Atomic rename
-            if os.path.exists(cache_file):
-                os.remove(cache_file)
-            os.rename(temp_file, cache_file)
+            self._mark_dirty(cache_file, cache_data)
             
             anime_id = anime_entry.get('id')
             print(f"Added anime ID {anime_id} to cache in status '{status}'")
@@ -145,61 +457,30 @@ class CacheManager:
         try:
             cache_file = self._get_cache_file_path(user_id)
             
-            if not os.path.exists(cache_file):
+            # Mutations are applied to the in-memory copy
+            cache_data = self._load_cache_data(cache_file)
+            if cache_data is None:
                 print("No cache file found to update")
                 return False
             
-            # Load current cache
-            with open(cache_file, 'r', encoding='utf-8') as f:
-                cache_data = json.load(f)
-            
             # Verify cache is for correct user
             if cache_data.get('user_id') != user_id:
                 print("Cache user ID mismatch")
                 return False
             
+            # Never move an entry into a bucket the API does not have
+            new_status = updates.get('status')
+            if new_status is not None and new_status not in VALID_STATUSES:
+                print(f"Unknown status '{new_status}' for anime ID {anime_id}")
+                return False
+            
             # Find and update the anime entry
             anime_list_data = cache_data.get('data', {})
-            updated = False
-            
-            for status_key, anime_list in anime_list_data.items():
-                for i, entry in enumerate(anime_list):
-                    if entry.get('id') == anime_id:
-                        # Check if status is changing (need to move between lists)
-                        old_status = entry.get('status', '')
-                        new_status = updates.get('status', old_status)
-                        
-                        if new_status != old_status and new_status in anime_list_data:
-                            # Remove from old status list
-                            anime_list_data[status_key].pop(i)
-                            # Update the entry with new data
-                            entry.update(updates)
-                            # Add to new status list
-                            anime_list_data[new_status].append(entry)
-                        else:
-                            # Just update in place
-                            entry.update(updates)
-                        
-                        updated = True
-                        break
-                
-                if updated:
-                    break
+            with self._lock:
+                updated = self._update_entry(cache_file, anime_list_data, anime_id, updates)
             
             if updated:
-                # Update timestamp to mark cache as recently modified
-                cache_data['timestamp'] = time.time()
-                cache_data['datetime'] = datetime.now().isoformat()
-                
-                # Write back to cache file
-                temp_file = cache_file + '.tmp'
-                with open(temp_file, 'w', encoding='utf-8') as f:
-                    json.dump(cache_data, f, ensure_ascii=False, indent=2)
-                
-                # Atomic rename
-                if os.path.exists(cache_file):
-                    os.remove(cache_file)
-                os.rename(temp_file, cache_file)
+                self._mark_dirty(cache_file, cache_data)
                 
                 print(f"Cache updated for anime ID {anime_id}")
                 return True
@@ -216,12 +497,10 @@ class CacheManager:
         try:
             cache_file = self._get_cache_file_path(user_id)
             
-            if not os.path.exists(cache_file):
+            cache_data = self._read_cache_meta(cache_file)
+            if cache_data is None:
                 return False
             
-            with open(cache_file, 'r', encoding='utf-8') as f:
-                cache_data = json.load(f)
-            
             # Check user ID
             if cache_data.get('user_id') != user_id:
                 return False
@@ -245,14 +524,21 @@ class CacheManager:
             if user_id:
                 # Clear specific user cache
                 cache_file = self._get_cache_file_path(user_id)
+                self._forget(cache_file)
+                for extra_file in (self._meta_path(cache_file), self._legacy_path(cache_file)):
+                    if extra_file and os.path.exists(extra_file):
+                        os.remove(extra_file)
                 if os.path.exists(cache_file):
                     os.remove(cache_file)
                     print(f"Cache cleared for user {user_id}")
             else:
                 # Clear all cache files
                 for file in os.listdir(self.cache_dir):
-                    if file.startswith('anime_list_') and file.endswith('.json'):
-                        os.remove(os.path.join(self.cache_dir, file))
+                    if file.startswith('anime_list_') and file.endswith(('.json', '.json.zst')):
+                        # Sidecars and uncompressed copies match the same pattern and go with them
+                        cache_file = os.path.join(self.cache_dir, file)
+                        self._forget(cache_file)
+                        os.remove(cache_file)
                 print("All cache files cleared")
                 
         except Exception as e:
@@ -262,6 +548,7 @@ class CacheManager:
         """Get information about cached data"""
         try:
             cache_file = self._get_cache_file_path(user_id)
+            self._wait_for_write(cache_file, self._meta_path(cache_file))
             
             if not os.path.exists(cache_file):
                 return {'exists': False}
@@ -269,20 +556,23 @@ class CacheManager:
             file_stat = os.stat(cache_file)
             file_size = file_stat.st_size
             
-            with open(cache_file, 'r', encoding='utf-8') as f:
-                cache_data = json.load(f)
+            # The sidecar already has the per-status counts, unless there are unsaved changes
+            meta_file = self._meta_path(cache_file)
+            with self._lock:
+                pending = cache_file in self._dirty
+            if not pending and os.path.exists(meta_file) and os.path.getmtime(meta_file) >= file_stat.st_mtime:
+                cache_data = self._read_json(meta_file)
+                status_counts = cache_data.get('status_counts', {})
+            else:
+                cache_data = self._load_cache_data(cache_file)
+                status_counts = {status: len(anime_list) for status, anime_list in cache_data.get('data', {}).items()}
             
             cache_timestamp = cache_data.get('timestamp', 0)
             cache_datetime = datetime.fromtimestamp(cache_timestamp)
             age_hours = (time.time() - cache_timestamp) / 3600
             
             # Count anime entries
-            total_anime = 0
-            status_counts = {}
-            for status, anime_list in cache_data.get('data', {}).items():
-                count = len(anime_list)
-                status_counts[status] = count
-                total_anime += count
+            total_anime = sum(status_counts.values())
             
             return {
                 'exists': True,
@@ -298,10 +588,15 @@ class CacheManager:
         except Exception as e:
             return {'exists': False, 'error': str(e)}
     
+    def _get_details_file_paths(self, user_id: int) -> Tuple[str, str]:
+        """Get msgpack and legacy JSON paths of the detailed info cache"""
+        return (self._cache_path('anime_details', user_id, '.msgpack'),
+                self._cache_path('anime_details', user_id, '.json'))
+    
     def save_detailed_anime_info(self, user_id: int, anime_details: Dict[int, Dict[str, Any]]):
         """Save detailed anime info (including synonyms) to cache"""
         try:
-            cache_file = os.path.join(self.cache_dir, f"anime_details_{user_id}.json")
+            msgpack_file, json_file = self._get_details_file_paths(user_id)
             
             cache_data = {
                 'user_id': user_id,
@@ -310,15 +605,11 @@ class CacheManager:
                 'data': anime_details
             }
             
-            # Write to temporary file first, then rename for atomic operation
-            temp_file = cache_file + '.tmp'
-            with open(temp_file, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, ensure_ascii=False, indent=2)
-            
-            # Atomic rename
-            if os.path.exists(cache_file):
-                os.remove(cache_file)
-            os.rename(temp_file, cache_file)
+            if MSGPACK_AVAILABLE:
+                # Drop the JSON cache so it cannot shadow newer data if msgpack goes away
+                self._atomic_write(msgpack_file, msgpack.packb(cache_data, use_bin_type=True), obsolete=json_file)
+            else:
+                self._atomic_write_json(json_file, cache_data)
             
             print(f"Detailed anime info cached: {len(anime_details)} entries")
             return True
@@ -330,13 +621,24 @@ class CacheManager:
     def load_detailed_anime_info(self, user_id: int) -> Optional[Dict[int, Dict[str, Any]]]:
         """Load detailed anime info from cache"""
         try:
-            cache_file = os.path.join(self.cache_dir, f"anime_details_{user_id}.json")
+            msgpack_file, json_file = self._get_details_file_paths(user_id)
+            self._wait_for_write(msgpack_file, json_file)
             
-            if not os.path.exists(cache_file):
+            if MSGPACK_AVAILABLE and os.path.exists(msgpack_file):
+                with open(msgpack_file, 'rb') as f:
+                    cache_data = msgpack.unpackb(f.read(), raw=False, strict_map_key=False)
+                
+                # Verify cache is for correct user
+                if cache_data.get('user_id') != user_id:
+                    return None
+                
+                # msgpack keeps the integer keys
+                return cache_data.get('data') or {}
+            
+            if not os.path.exists(json_file):
                 return None
             
-            with open(cache_file, 'r', encoding='utf-8') as f:
-                cache_data = json.load(f)
+            cache_data = self._read_json(json_file)
             
             # Verify cache is for correct user
             if cache_data.get('user_id') != user_id:
@@ -361,10 +663,21 @@ class CacheManager:
             print(f"Error loading detailed anime info: {e}")
             return None
     
+    def clear_detailed_anime_info(self, user_id: int):
+        """Remove the detailed anime info cache in either format"""
+        paths = self._get_details_file_paths(user_id)
+        with self._write_lock:
+            for cache_file in paths:
+                self._pending.pop(cache_file, None)
+        self._wait_for_write(*paths)
+        for cache_file in paths:
+            if os.path.exists(cache_file):
+                os.remove(cache_file)
+    
     # Manga cache methods
     def _get_manga_cache_file_path(self, user_id: int) -> str:
         """Get manga cache file path for specific user"""
-        return os.path.join(self.cache_dir, f"manga_list_{user_id}.json")
+        return self._cache_path('manga_list', user_id, LIST_CACHE_EXT)
     
     def save_manga_list(self, user_id: int, manga_list_data: Dict[str, List[Dict[str, Any]]]):
         """Save manga list data to cache"""
@@ -375,18 +688,10 @@ class CacheManager:
                 'user_id': user_id,
                 'timestamp': time.time(),
                 'datetime': datetime.now().isoformat(),
-                'data': manga_list_data
+                'data': self._copy_list_data(manga_list_data)
             }
             
-            # Write to temporary file first, then rename for atomic operation
-            temp_file = cache_file + '.tmp'
-            with open(temp_file, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, ensure_ascii=False, indent=2)
-            
-            # Atomic rename
-            if os.path.exists(cache_file):
-                os.remove(cache_file)
-            os.rename(temp_file, cache_file)
+            self._store_cache_data(cache_file, cache_data)
             
             print(f"Manga cache saved: {cache_file}")
             return True
@@ -400,20 +705,18 @@ class CacheManager:
         try:
             cache_file = self._get_manga_cache_file_path(user_id)
             
-            if not os.path.exists(cache_file):
+            cache_data = self._load_cache_data(cache_file)
+            if cache_data is None:
                 print("No manga cache file found")
                 return None
             
-            with open(cache_file, 'r', encoding='utf-8') as f:
-                cache_data = json.load(f)
-            
             # Verify cache is for correct user
             if cache_data.get('user_id') != user_id:
                 print("Manga cache user ID mismatch")
                 return None
             
             print(f"Manga cache loaded from: {cache_data.get('datetime', 'unknown time')}")
-            return cache_data.get('data')
+            return self._copy_list_data(cache_data.get('data'))
         
         except Exception as e:
             print(f"Error loading manga cache: {e}")
@@ -424,14 +727,12 @@ class CacheManager:
         try:
             cache_file = self._get_manga_cache_file_path(user_id)
             
-            if not os.path.exists(cache_file):
+            # Mutations are applied to the in-memory copy
+            cache_data = self._load_cache_data(cache_file)
+            if cache_data is None:
                 print("No manga cache file found to add manga to")
                 return False
             
-            # Load current cache
-            with open(cache_file, 'r', encoding='utf-8') as f:
-                cache_data = json.load(f)
-            
             # Verify cache is for correct user
             if cache_data.get('user_id') != user_id:
                 print("Manga cache user ID mismatch")
@@ -439,28 +740,16 @@ class CacheManager:
             
             # Get the status to add the manga to
             status = manga_entry.get('status', 'planned')
+            if status not in VALID_MANGA_STATUSES:
+                print(f"Unknown status '{status}' for manga ID {manga_entry.get('id')}")
+                return False
             manga_list_data = cache_data.get('data', {})
             
-            # Make sure the status list exists
-            if status not in manga_list_data:
-                manga_list_data[status] = []
-            
             # Add the new manga entry
-            manga_list_data[status].append(manga_entry)
+            with self._lock:
+                self._append_entry(cache_file, manga_list_data, status, dict(manga_entry))
             
-            # Update timestamp to mark cache as recently modified
-            cache_data['timestamp'] = time.time()
-            cache_data['datetime'] = datetime.now().isoformat()
-            
-            # Write back to cache file
-            temp_file = cache_file + '.tmp'
-            with open(temp_file, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, ensure_ascii=False, indent=2)
-            
-            # Atomic rename
-            if os.path.exists(cache_file):
-                os.remove(cache_file)
-            os.rename(temp_file, cache_file)
+            self._mark_dirty(cache_file, cache_data)
             
             manga_id = manga_entry.get('id')
             print(f"Added manga ID {manga_id} to cache in status '{status}'")
@@ -475,61 +764,30 @@ class CacheManager:
         try:
             cache_file = self._get_manga_cache_file_path(user_id)
             
-            if not os.path.exists(cache_file):
+            # Mutations are applied to the in-memory copy
+            cache_data = self._load_cache_data(cache_file)
+            if cache_data is None:
                 print("No manga cache file found to update")
                 return False
             
-            # Load current cache
-            with open(cache_file, 'r', encoding='utf-8') as f:
-                cache_data = json.load(f)
-            
             # Verify cache is for correct user
             if cache_data.get('user_id') != user_id:
                 print("Manga cache user ID mismatch")
                 return False
             
+            # Never move an entry into a bucket the API does not have
+            new_status = updates.get('status')
+            if new_status is not None and new_status not in VALID_MANGA_STATUSES:
+                print(f"Unknown status '{new_status}' for manga ID {manga_id}")
+                return False
+            
             # Find and update the manga entry
             manga_list_data = cache_data.get('data', {})
-            updated = False
-            
-            for status_key, manga_list in manga_list_data.items():
-                for i, entry in enumerate(manga_list):
-                    if entry.get('id') == manga_id:
-                        # Check if status is changing (need to move between lists)
-                        old_status = entry.get('status', '')
-                        new_status = updates.get('status', old_status)
-                        
-                        if new_status != old_status and new_status in manga_list_data:
-                            # Remove from old status list
-                            manga_list_data[status_key].pop(i)
-                            # Update the entry with new data
-                            entry.update(updates)
-                            # Add to new status list
-                            manga_list_data[new_status].append(entry)
-                        else:
-                            # Just update in place
-                            entry.update(updates)
-                        
-                        updated = True
-                        break
-                
-                if updated:
-                    break
+            with self._lock:
+                updated = self._update_entry(cache_file, manga_list_data, manga_id, updates)
             
             if updated:
-                # Update timestamp to mark cache as recently modified
-                cache_data['timestamp'] = time.time()
-                cache_data['datetime'] = datetime.now().isoformat()
-                
-                # Write back to cache file
-                temp_file = cache_file + '.tmp'
-                with open(temp_file, 'w', encoding='utf-8') as f:
-                    json.dump(cache_data, f, ensure_ascii=False, indent=2)
-                
-                # Atomic rename
-                if os.path.exists(cache_file):
-                    os.remove(cache_file)
-                os.rename(temp_file, cache_file)
+                self._mark_dirty(cache_file, cache_data)
                 
                 print(f"Manga cache updated for manga ID {manga_id}")
                 return True
@@ -546,12 +804,10 @@ class CacheManager:
         try:
             cache_file = self._get_manga_cache_file_path(user_id)
             
-            if not os.path.exists(cache_file):
+            cache_data = self._read_cache_meta(cache_file)
+            if cache_data is None:
                 return False
             
-            with open(cache_file, 'r', encoding='utf-8') as f:
-                cache_data = json.load(f)
-            
             # Check user ID
             if cache_data.get('user_id') != user_id:
                 return False
@@ -3,13 +3,18 @@ Configuration management for Shikimori Updater
 """
 
 import os
+import copy
 import json
+import atexit
+import threading
 from pathlib import Path
 from dotenv import load_dotenv
 
 class Config:
     """Application configuration manager"""
     
+    SAVE_DELAY = 0.2  # Seconds to batch set() calls into one save
+    
     def __init__(self):
         self.app_dir = Path.home() / ".shikimori_updater"
         self.config_file = self.app_dir / "config.json"
@@ -54,6 +59,13 @@ class Config:
         }
         
         self.config = self.load_config()
+        
+        self._split_cache = {}
+        self._dirty = False
+        self._save_lock = threading.RLock()  # Guards self.config against saves mid-set()
+        self._write_lock = threading.Lock()  # Keeps snapshots hitting the file in the order taken
+        self._save_timer = None
+        atexit.register(self.flush)
     
     def load_config(self):
         """Load configuration from file"""
@@ -66,29 +78,69 @@ class Config:
             except Exception as e:
                 print(f"Error loading config: {e}")
         
-        return self.default_config.copy()
+        return copy.deepcopy(self.default_config)
     
     def save_config(self):
         """Save configuration to file"""
-        try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=2)
-        except Exception as e:
-            print(f"Error saving config: {e}")
+        with self._write_lock:
+            # Serialize a snapshot under the lock, set() may run on other threads meanwhile
+            with self._save_lock:
+                self._dirty = False
+                if self._save_timer is not None:
+                    self._save_timer.cancel()
+                    self._save_timer = None
+                try:
+                    data = json.dumps(self.config, indent=2)
+                except Exception as e:
+                    print(f"Error saving config: {e}")
+                    return
+            
+            # Write next to the file and swap it in, a failed write leaves the old config intact
+            temp_file = self.config_file.with_name(self.config_file.name + '.tmp')
+            try:
+                with open(temp_file, 'w', encoding='utf-8') as f:
+                    f.write(data)
+                os.replace(temp_file, self.config_file)
+            except Exception as e:
+                print(f"Error saving config: {e}")
+    
+    def flush(self):
+        """Save now if set() calls are still waiting to be written"""
+        if self._dirty:
+            self.save_config()
+    
+    def _schedule_save(self):
+        """Mark the config dirty and save it once SAVE_DELAY has passed"""
+        with self._save_lock:
+            self._dirty = True
+            if self._save_timer is None:
+                self._save_timer = threading.Timer(self.SAVE_DELAY, self.flush)
+                self._save_timer.daemon = True
+                self._save_timer.start()
+    
+    def _split(self, key_path):
+        """Split a dot-separated key path, memoized"""
+        keys = self._split_cache.get(key_path)
+        if keys is None:
+            keys = self._split_cache[key_path] = tuple(key_path.split('.'))
+        return keys
     
     def _merge_config(self, default, loaded):
-        """Recursively merge loaded config with defaults"""
-        result = default.copy()
-        for key, value in loaded.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = self._merge_config(result[key], value)
-            else:
-                result[key] = value
+        """Merge loaded config over a copy of the defaults"""
+        result = copy.deepcopy(default)
+        stack = [(result, loaded)]
+        while stack:
+            target, source = stack.pop()
+            for key, value in source.items():
+                if isinstance(value, dict) and isinstance(target.get(key), dict):
+                    stack.append((target[key], value))
+                else:
+                    target[key] = value
         return result
     
     def get(self, key_path, default=None):
         """Get config value by dot-separated key path"""
-        keys = key_path.split('.')
+        keys = self._split(key_path)
         value = self.config
         
         for key in keys:
@@ -101,16 +153,17 @@ class Config:
     
     def set(self, key_path, value):
         """Set config value by dot-separated key path"""
-        keys = key_path.split('.')
-        config = self.config
-        
-        for key in keys[:-1]:
-            if key not in config:
-                config[key] = {}
-            config = config[key]
-        
-        config[keys[-1]] = value
-        self.save_config()
+        keys = self._split(key_path)
+        with self._save_lock:
+            config = self.config
+            
+            for key in keys[:-1]:
+                if key not in config:
+                    config[key] = {}
+                config = config[key]
+            
+            config[keys[-1]] = value
+            self._schedule_save()
     
     @property
     def is_authenticated(self):
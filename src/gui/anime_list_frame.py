@@ -9,20 +9,90 @@ try:
 except ImportError:
     import tkinter.simpledialog as simpledialog
 from typing import Dict, List, Any, Optional
+from operator import itemgetter
 import threading
 import webbrowser
+from utils.logger import get_logger
+
+# Shared tag tuples, so rows don't allocate their own
+TAGS_NON_RELEASED = ('non_released',)
+TAGS_EMPTY = ()
+
+
+class _Row:
+    """Display and filter fields of one list entry, computed once per update_list"""
+    
+    __slots__ = ('iid', 'anime_id', 'status_key', 'name', 'name_lower', 'year', 'kind_upper',
+                 'score', 'episodes', 'total_eps', 'entry', 'display', 'sort_keys', 'tags')
+    
+    def __init__(self, status_key: str, status_display: str, anime_entry: Dict[str, Any]):
+        anime = anime_entry['anime']
+        self.iid = str(anime_entry.get('id'))
+        self.anime_id = anime.get('id')
+        self.status_key = status_key
+        self.name = anime.get('name', '')
+        self.name_lower = self.name.lower()
+        aired_on = anime.get('aired_on', '')
+        self.year = aired_on[:4] if aired_on else '-'
+        self.kind_upper = anime.get('kind', '').upper()
+        self.score = anime_entry.get('score', 0) or 0
+        self.episodes = anime_entry.get('episodes', 0)
+        self.total_eps = anime.get('episodes', '?')
+        self.entry = anime_entry
+        self.display = (
+            self.name,
+            status_display,
+            f"{self.episodes}/{self.total_eps}",
+            self.score if self.score > 0 else "-",
+            self.kind_upper,
+            self.year
+        )
+        # Sort keys in column order, "-" and missing numbers sort as 0
+        self.sort_keys = (
+            self.name,
+            status_display,
+            self.episodes or 0,
+            self.score,
+            self.kind_upper,
+            int(self.year) if self.year.isdigit() else 0
+        )
+        self.tags = TAGS_EMPTY  # Set from the detailed anime cache, see AnimeListFrame._tag_rows
+
 
 class AnimeListFrame(ttk.Frame):
     """Frame for displaying and managing anime list"""
     
+    FILTER_DEBOUNCE_MS = 200  # Wait for a pause in typing before filtering
+    RENDER_CHUNK = 200  # Rows materialized in the tree at a time, more are added on scroll
+    BULK_INSERT = 50  # Inserting at least this many rows hides the columns meanwhile
+    
     def __init__(self, parent, main_window):
         super().__init__(parent)
+        self.logger = get_logger('anime_list_frame')
         self.main_window = main_window
         self.anime_data: Dict[str, List[Dict[str, Any]]] = {}
         self.item_data: Dict[str, Dict[str, Any]] = {}  # Store anime data by item ID
         self.sort_column = None
         self.sort_reverse = False
         self.filtered_data = []  # Store filtered data for sorting
+        self._filtered_key = None  # (filter signature, status) filtered_data was built for
+        self._filter_after_id = None  # Pending debounced search filter
+        # Rows currently in the tree, keyed by user rate id: order and (values, tags)
+        self._current_iids: List[str] = []
+        self._row_state: Dict[str, Any] = {}
+        # Full sorted/filtered rows of the current view and how many are in the tree
+        self._view_rows = []
+        self._render_limit = self.RENDER_CHUNK
+        self._render_pending = False
+        # Precomputed rows per status, rebuilt by update_list
+        self._rows: Dict[str, List[_Row]] = {}
+        self._by_status_year: Dict[str, Dict[str, List[_Row]]] = {}  # Same rows grouped by year
+        self._rows_token = 0  # Bumped per update_list, see _commit_rows
+        self._tags_key = None  # Detailed cache (id, size) the row tags were computed from
+        # Tab counts per filter signature, valid until the rows change
+        self._count_cache: Dict[tuple, Dict[str, int]] = {}
+        self._year_values: List[str] = []  # Current year dropdown values
+        self._counters_pending = False  # Inactive tab counters waiting for idle
         
         self._create_widgets()
     
@@ -59,6 +129,7 @@ class AnimeListFrame(ttk.Frame):
         
         # Bind tab change event
         self.status_tabs.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+        self.status_tabs.bind("<Enter>", self._on_tabs_enter)
         
         # Create tree content directly below tabs
         self._create_tab_content()
@@ -68,6 +139,7 @@ class AnimeListFrame(ttk.Frame):
         current_tab_index = self.status_tabs.index(self.status_tabs.select())
         status_order = ['watching', 'planned', 'completed', 'on_hold', 'dropped', 'rewatching']
         self.current_status = status_order[current_tab_index]
+        self._render_limit = self.RENDER_CHUNK
         self._populate_tree()
     
     def _create_filters(self):
@@ -89,7 +161,7 @@ class AnimeListFrame(ttk.Frame):
         self.year_var = tk.StringVar(value="All")
         year_combo = ttk.Combobox(filter_frame, textvariable=self.year_var, width=8, state="readonly")
         year_combo.pack(side=tk.LEFT, padx=(0, 10))
-        year_combo.bind("<<ComboboxSelected>>", self._filter_changed)
+        year_combo.bind("<<ComboboxSelected>>", self._do_filter)
         
         # Type filter (static values)
         ttk.Label(filter_frame, text="Type:").pack(side=tk.LEFT, padx=(0, 5))
@@ -98,7 +170,7 @@ class AnimeListFrame(ttk.Frame):
                                       values=["All", "TV", "Movie", "OVA", "ONA", "Special", "Music"],
                                       width=8, state="readonly")
         self.type_combo.pack(side=tk.LEFT, padx=(0, 10))
-        self.type_combo.bind("<<ComboboxSelected>>", self._filter_changed)
+        self.type_combo.bind("<<ComboboxSelected>>", self._do_filter)
         
         # Score filter
         ttk.Label(filter_frame, text="Score:").pack(side=tk.LEFT, padx=(0, 5))
@@ -107,7 +179,7 @@ class AnimeListFrame(ttk.Frame):
                                   values=["All", "Not Scored", "1+", "2+", "3+", "4+", "5+", "6+", "7+", "8+", "9+", "10"],
                                   width=8, state="readonly")
         score_combo.pack(side=tk.LEFT, padx=(0, 10))
-        score_combo.bind("<<ComboboxSelected>>", self._filter_changed)
+        score_combo.bind("<<ComboboxSelected>>", self._do_filter)
         
         # Store combo boxes for updating
         self.year_combo = year_combo
@@ -157,7 +229,8 @@ class AnimeListFrame(ttk.Frame):
         # Scrollbars
         v_scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.tree.yview)
         h_scrollbar = ttk.Scrollbar(tree_frame, orient=tk.HORIZONTAL, command=self.tree.xview)
-        self.tree.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
+        self.v_scrollbar = v_scrollbar
+        self.tree.configure(yscrollcommand=self._on_yscroll, xscrollcommand=h_scrollbar.set)
         
         # Pack treeview and scrollbars
         self.tree.grid(row=0, column=0, sticky="nsew")
@@ -211,8 +284,15 @@ class AnimeListFrame(ttk.Frame):
             self.context_menu.post(event.x_root, event.y_root)
     
     def _filter_changed(self, event=None):
+        """Handle typing in the search box, filtering once typing pauses"""
+        if self._filter_after_id is not None:
+            self.after_cancel(self._filter_after_id)
+        self._filter_after_id = self.after(self.FILTER_DEBOUNCE_MS, self._do_filter)
+    
+    def _do_filter(self, event=None):
         """Handle filter changes"""
-        self._update_filter_options()
+        self._filter_after_id = None
+        self._render_limit = self.RENDER_CHUNK
         self._populate_tree()
     
     def _clear_all_filters(self):
@@ -221,6 +301,7 @@ class AnimeListFrame(ttk.Frame):
         self.year_var.set("All")
         self.type_var.set("All")
         self.score_var.set("All")
+        self._render_limit = self.RENDER_CHUNK
         self._populate_tree()
         
     def _sort_column(self, column):
@@ -234,8 +315,11 @@ class AnimeListFrame(ttk.Frame):
         # Update column headers to show sort direction
         self._update_column_headers()
         
-        # Re-populate with sorting
-        self._populate_tree()
+        # Same rows in a new order: re-sort and let _sync_tree move the existing items
+        if self._filtered_key == (self._filter_signature(), self.current_status):
+            self._show_filtered()
+        else:
+            self._populate_tree()
     
     def _update_column_headers(self):
         """Update column headers to show sort direction"""
@@ -261,27 +345,15 @@ class AnimeListFrame(ttk.Frame):
         if not self.anime_data:
             return
         
-        # Collect all unique years and types
-        years = set()
-        types = set()
-        
-        for anime_list in self.anime_data.values():
-            for anime_entry in anime_list:
-                anime = anime_entry.get('anime', {})
-                
-                # Extract year
-                aired_on = anime.get('aired_on', '')
-                if aired_on and len(aired_on) >= 4:
-                    years.add(aired_on[:4])
-                
-                # Extract type
-                kind = anime.get('kind', '')
-                if kind:
-                    types.add(kind.upper())
+        # Collect all unique years from the precomputed rows
+        years = {row.year for anime_list in self._rows.values() for row in anime_list
+                 if len(row.year) == 4}
         
-        # Update year dropdown
+        # Update year dropdown, only when the set of years changed
         year_values = ["All"] + sorted(years, reverse=True)
-        self.year_combo['values'] = year_values
+        if year_values != self._year_values:
+            self._year_values = year_values
+            self.year_combo['values'] = year_values
         
         # Note: Type dropdown uses static values and is not updated dynamically
     
@@ -298,207 +370,348 @@ class AnimeListFrame(ttk.Frame):
     def update_list(self, anime_data: Dict[str, List[Dict[str, Any]]]):
         """Update anime list data and refresh display"""
         self.anime_data = anime_data
+        # Rows are precomputed off the Tk thread, a newer update discards older results
+        self._rows_token += 1
+        # The worker gets its own status lists, edits on the Tk thread may move entries meanwhile
+        snapshot = {status_key: list(anime_list) for status_key, anime_list in anime_data.items()}
+        threading.Thread(target=self._precompute_rows, args=(self._rows_token, snapshot),
+                         daemon=True).start()
+    
+    def _precompute_rows(self, token: int, anime_data: Dict[str, List[Dict[str, Any]]]):
+        """Build rows in a worker thread and hand them to the Tk thread"""
+        try:
+            rows = self._build_rows(anime_data)
+            by_year = self._index_by_year(rows)
+            tags_key = self._tag_rows(rows, self._detailed_cache())
+        except Exception as e:
+            self.logger.error(f"Error precomputing anime rows: {e}", exc_info=True)
+            self.after(0, self._rebuild_rows_now, token)
+            return
+        self.after(0, self._commit_rows, token, rows, by_year, tags_key)
+    
+    def _rebuild_rows_now(self, token: int):
+        """Fallback when the worker failed: build the rows on the Tk thread"""
+        if token != self._rows_token:
+            return
+        rows = self._build_rows(self.anime_data)
+        by_year = self._index_by_year(rows)
+        tags_key = self._tag_rows(rows, self._detailed_cache())
+        self._commit_rows(token, rows, by_year, tags_key)
+    
+    def _commit_rows(self, token: int, rows: Dict[str, List[_Row]],
+                     by_year: Dict[str, Dict[str, List[_Row]]], tags_key: tuple):
+        """Show precomputed rows unless a newer update_list or clear_list came in"""
+        if token != self._rows_token:
+            return
+        self._tags_key = tags_key
         self.item_data.clear()  # Clear existing item data
+        self._rows = rows
+        self._by_status_year = by_year
+        self._count_cache.clear()
+        self._update_filter_options()
         self._populate_tree()
     
+    def refresh_entry(self, rate_id: int):
+        """Rebuild the row of one edited entry and redraw the current view"""
+        iid = str(rate_id)
+        old_location = next(((status_key, i) for status_key, rows in self._rows.items()
+                             for i, row in enumerate(rows) if row.iid == iid), None)
+        new_location = next(((status_key, entry) for status_key, anime_list in self.anime_data.items()
+                             for entry in anime_list if entry.get('id') == rate_id), None)
+        if old_location is None or new_location is None:
+            # Not shown yet, or precompute still running: rebuild everything
+            self.update_list(self.anime_data)
+            return
+        
+        old_status, i = old_location
+        new_status, anime_entry = new_location
+        statuses = self.main_window.get_shikimori_client().STATUSES
+        row = _Row(new_status, statuses.get(new_status, new_status), anime_entry)
+        self._tag_rows({new_status: [row]}, self._detailed_cache())
+        
+        # Same place in its status, or appended to the new one like the cache does
+        if new_status == old_status:
+            self._rows[old_status][i] = row
+        else:
+            self._rows[old_status].pop(i)
+            self._rows.setdefault(new_status, []).append(row)
+        for status_key in {old_status, new_status}:
+            self._by_status_year.update(self._index_by_year({status_key: self._rows[status_key]}))
+        
+        self._count_cache.clear()
+        self._populate_tree()
+    
+    def _build_rows(self, anime_data: Dict[str, List[Dict[str, Any]]]) -> Dict[str, List[_Row]]:
+        """Precompute display and filter fields for every entry"""
+        statuses = self.main_window.get_shikimori_client().STATUSES
+        return {
+            status_key: [_Row(status_key, statuses.get(status_key, status_key), anime_entry)
+                         for anime_entry in anime_list if anime_entry.get('anime')]
+            for status_key, anime_list in anime_data.items()
+        }
+    
+    @staticmethod
+    def _index_by_year(rows: Dict[str, List[_Row]]) -> Dict[str, Dict[str, List[_Row]]]:
+        """Group each status's rows by year, keeping their order"""
+        by_year = {}
+        for status_key, anime_list in rows.items():
+            years = by_year[status_key] = {}
+            for row in anime_list:
+                years.setdefault(row.year, []).append(row)
+        return by_year
+    
+    def _candidate_rows(self, status_key: str, year_filter: str) -> List[_Row]:
+        """Rows of a status narrowed down by the year filter"""
+        if year_filter == "All":
+            return self._rows.get(status_key, [])
+        return self._by_status_year.get(status_key, {}).get(year_filter, [])
+    
+    def _detailed_cache(self) -> Dict[int, Dict[str, Any]]:
+        """The matcher's detailed anime info, empty until it is loaded"""
+        anime_matcher = getattr(self.main_window, 'anime_matcher', None)
+        return getattr(anime_matcher, 'detailed_anime_cache', {})
+    
+    @staticmethod
+    def _tag_rows(rows: Dict[str, List[_Row]], detailed_cache: Dict[int, Dict[str, Any]]) -> tuple:
+        """Set row tags from the detailed cache, returning the key they were computed for"""
+        for anime_list in rows.values():
+            for row in anime_list:
+                details = detailed_cache.get(row.anime_id) if row.anime_id else None
+                anime_status = (details.get('status') or '').lower() if details else ''
+                
+                # Color anime that are not released (ongoing, announced, etc.)
+                row.tags = TAGS_NON_RELEASED if anime_status and anime_status != 'released' else TAGS_EMPTY
+        return id(detailed_cache), len(detailed_cache)
+    
     def clear_list(self):
         """Clear anime list"""
         self.anime_data.clear()
+        self._rows_token += 1
+        self._rows = {}
+        self._by_status_year = {}
+        self._count_cache.clear()
         self._populate_tree()
     
+    def _sync_tree(self, rows):
+        """Make the tree show rows (iid, values, tags, entry) in order, touching only what changed"""
+        tree = self.tree
+        old_state = self._row_state
+        new_iids = [row[0] for row in rows]
+        new_set = set(new_iids)
+        
+        stale = [iid for iid in self._current_iids if iid not in new_set]
+        if stale:
+            tree.delete(*stale)
+            for iid in stale:
+                self.item_data.pop(iid, None)
+        
+        # Rows that stay only need moving if their relative order changed
+        kept_old_order = [iid for iid in self._current_iids if iid in new_set]
+        kept_new_order = [iid for iid in new_iids if iid in old_state]
+        reorder = kept_old_order != kept_new_order
+        
+        # Hide the data columns for big batches so Tk lays them out once at the end
+        frozen = sum(1 for iid in new_iids if iid not in old_state) >= self.BULK_INSERT
+        if frozen:
+            tree.configure(displaycolumns=())
+        try:
+            new_state = self._apply_rows(rows, old_state, reorder)
+        finally:
+            if frozen:
+                tree.configure(displaycolumns="#all")
+        
+        self._current_iids = new_iids
+        self._row_state = new_state
+    
+    def _apply_rows(self, rows, old_state, reorder: bool) -> Dict[str, Any]:
+        """Insert, update and move tree items for _sync_tree, returning the new row state"""
+        tree = self.tree
+        new_state = {}
+        for index, (iid, values, tags, anime_entry) in enumerate(rows):
+            state = (values, tags)
+            previous = old_state.get(iid)
+            if previous is None:
+                if tags:
+                    tree.insert("", index, iid=iid, values=values, tags=tags)
+                else:
+                    tree.insert("", index, iid=iid, values=values)
+            else:
+                if previous != state:
+                    tree.item(iid, values=values, tags=tags)
+                if reorder:
+                    tree.move(iid, "", index)
+            new_state[iid] = state
+            self.item_data[iid] = anime_entry
+        return new_state
+    
+    def _on_yscroll(self, first, last):
+        """Update the scrollbar and materialize more rows when nearing the end"""
+        self.v_scrollbar.set(first, last)
+        if (float(last) > 0.9 and self._render_limit < len(self._view_rows)
+                and not self._render_pending):
+            # Not from inside the scroll callback, the tree is still laying out
+            self._render_limit += self.RENDER_CHUNK
+            self._schedule_render()
+    
+    def _schedule_render(self):
+        """Sync the tree once Tk is idle, so repeated repopulates paint only once"""
+        if not self._render_pending:
+            self._render_pending = True
+            self.after_idle(self._render_view)
+    
+    def _render_view(self):
+        """Show the first _render_limit rows of the current view"""
+        self._render_pending = False
+        self._sync_tree(self._view_rows[:self._render_limit])
+    
+    def _filter_signature(self) -> tuple:
+        """Current (needle, year, type, score) filter values, the needle lowercased"""
+        # Lowercased once per populate, rows carry their lowercased names
+        needle = self.search_var.get().lower() if hasattr(self, 'search_var') else ''
+        year_filter = self.year_var.get() if hasattr(self, 'year_var') else 'All'
+        type_filter = self.type_var.get() if hasattr(self, 'type_var') else 'All'
+        score_filter = self.score_var.get() if hasattr(self, 'score_var') else 'All'
+        return needle, year_filter, type_filter, score_filter
+    
     def _populate_tree(self):
         """Populate treeview with filtered anime data"""
-        # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
         if not self.anime_data:
-            self._update_tab_counters({})
+            self.filtered_data = []
+            self._filtered_key = None
+            self._view_rows = []
+            self._sync_tree([])
+            self._update_tab_counters(dict.fromkeys(self.tab_counters, 0))
             return
         
         # Get filter values
-        search_filter = self.search_var.get().lower() if hasattr(self, 'search_var') else ''
-        year_filter = self.year_var.get() if hasattr(self, 'year_var') else 'All'
-        type_filter = self.type_var.get() if hasattr(self, 'type_var') else 'All'
-        score_filter = self.score_var.get() if hasattr(self, 'score_var') else 'All'
-        
-        filtered_data = []
-        
-        # Status mapping for reverse lookup
-        status_map = {v: k for k, v in self.main_window.get_shikimori_client().STATUSES.items()}
-        
-        item_count = 0
-        
-        # Collect counters for all statuses
-        status_counters = {}
+        filter_signature = self._filter_signature()
+        current_status = self.current_status
+        
+        # Collect filtered data for sorting
+        candidates = self._candidate_rows(current_status, filter_signature[1])
+        matching = self._filter_rows(candidates, filter_signature)
+        filtered_data = [row.sort_keys + (row,) for row in matching]
+        
+        self.filtered_data = filtered_data
+        self._filtered_key = (filter_signature, current_status)
+        self._show_filtered()
+        
+        # The active tab's counter is always fresh, the others are counted once idle
+        status_counters = self._count_cache.get(filter_signature)
+        if status_counters is None:
+            status_counters = {current_status: len(matching)}
+            self._schedule_counter_refresh()
+        self._update_tab_counters(status_counters)
+    
+    def _filter_rows(self, rows: List[_Row], filter_signature: tuple) -> List[_Row]:
+        """Rows matching the (needle, year, type, score) filter signature"""
+        needle, year_filter, type_filter, score_filter = filter_signature
+        
+        # Parse the score filter once: "All", "Not Scored", "N+" or "10"
+        not_scored = score_filter == "Not Scored"
+        score_threshold = 0
+        if score_filter != "All" and not not_scored:
+            try:
+                score_threshold = int(score_filter.rstrip('+'))
+            except ValueError:
+                score_threshold = 0
         
-        # Process each status group
-        for status_key, anime_list in self.anime_data.items():
-            status_display = self.main_window.get_shikimori_client().STATUSES.get(status_key, status_key)
+        matching = []
+        for row in rows:
+            # Apply search filter
+            if needle and needle not in row.name_lower:
+                continue
             
-            # Skip if not the current tab's status
-            if status_key != self.current_status:
-                # Still count for tab counter
-                filtered_count = self._count_filtered_anime(anime_list, search_filter, year_filter, type_filter, score_filter)
-                status_counters[status_key] = filtered_count
+            # Apply year filter
+            if year_filter != "All" and row.year != year_filter:
                 continue
             
-            # Count filtered items for current tab
-            filtered_count = self._count_filtered_anime(anime_list, search_filter, year_filter, type_filter, score_filter)
-            status_counters[status_key] = filtered_count
+            # Apply type filter
+            if type_filter != "All" and row.kind_upper != type_filter:
+                continue
             
-            # Add items for this status
-            for anime_entry in anime_list:
-                anime = anime_entry.get('anime', {})
-                if not anime:
-                    continue
-                
-                # Apply search filter
-                anime_name = anime.get('name', '')
-                if search_filter and search_filter not in anime_name.lower():
-                    continue
-                
-                # Apply year filter
-                aired_on = anime.get('aired_on', '')
-                year = aired_on[:4] if aired_on else '-'
-                if year_filter != "All" and year != year_filter:
-                    continue
-                
-                # Apply type filter
-                anime_type = anime.get('kind', '').upper()
-                if type_filter != "All" and anime_type != type_filter:
+            # Apply score filter
+            if not_scored:
+                if row.score > 0:
                     continue
-                
-                # Apply score filter
-                score = anime_entry.get('score', 0) or 0
-                if score_filter != "All":
-                    if score_filter == "Not Scored":
-                        if score > 0:
-                            continue
-                    else:
-                        try:
-                            score_threshold = int(score_filter[0])
-                            if score_threshold and score < score_threshold:
-                                continue
-                        except (ValueError, IndexError):
-                            continue
-
-                # Prepare display values
-                progress = f"{anime_entry.get('episodes', 0)}/{anime.get('episodes', '?')}"
-                score_display = score if score > 0 else "-"
-                
-                # Collect filtered data for sorting
-                filtered_data.append((
-                    anime_name,
-                    status_display,
-                    progress,
-                    score_display,
-                    anime_type,
-                    year,
-                    anime_entry
-                ))
-        
-        # Sort data
+            elif row.score < score_threshold:
+                continue
+            
+            matching.append(row)
+        return matching
+    
+    def _schedule_counter_refresh(self):
+        """Count the inactive tabs once Tk is idle, after the current tab is drawn"""
+        if not self._counters_pending:
+            self._counters_pending = True
+            self.after_idle(self._refresh_inactive_counters)
+    
+    def _on_tabs_enter(self, event=None):
+        """Bring pending tab counters up to date when the pointer reaches the tabs"""
+        if self._counters_pending:
+            self._refresh_inactive_counters()
+    
+    def _refresh_inactive_counters(self):
+        """Count every status for the current filters and update the tab labels"""
+        if not self._counters_pending:
+            return
+        self._counters_pending = False
+        if not self.anime_data:
+            return
+        
+        filter_signature = self._filter_signature()
+        status_counters = self._count_cache.get(filter_signature)
+        if status_counters is None:
+            status_counters = {
+                status_key: len(self._filter_rows(
+                    self._candidate_rows(status_key, filter_signature[1]), filter_signature))
+                for status_key in self.tab_counters
+            }
+            self._count_cache[filter_signature] = status_counters
+        self._update_tab_counters(status_counters)
+    
+    def _show_filtered(self):
+        """Sort filtered_data and show it in the tree"""
+        # Sort a copy so ties keep the original order on every re-sort
+        filtered_data = list(self.filtered_data)
+        
+        # Sort data on the precomputed keys, numeric for Progress, Score and Year
         if self.sort_column:
             columns = ("Name", "Status", "Progress", "Score", "Type", "Year")
             col_index = columns.index(self.sort_column)
-            
-            # Custom sorting for different column types
-            if self.sort_column == "Score":
-                # Sort by numeric score, treating "-" as 0
-                filtered_data.sort(key=lambda x: 0 if x[col_index] == "-" else float(x[col_index]), reverse=self.sort_reverse)
-            elif self.sort_column == "Progress":
-                # Sort by current episode number
-                filtered_data.sort(key=lambda x: int(x[col_index].split('/')[0]), reverse=self.sort_reverse)
-            elif self.sort_column == "Year":
-                # Sort by year, treating "-" as 0
-                filtered_data.sort(key=lambda x: 0 if x[col_index] == "-" else int(x[col_index]), reverse=self.sort_reverse)
-            else:
-                # Default string sorting
-                filtered_data.sort(key=lambda x: x[col_index], reverse=self.sort_reverse)
+            filtered_data.sort(key=itemgetter(col_index), reverse=self.sort_reverse)
         else:
             # Sort by name by default
-            filtered_data.sort(key=lambda x: x[0])  # Sort by Name (index 0)
+            filtered_data.sort(key=itemgetter(0))  # Sort by Name (index 0)
         
-        # Insert sorted and filtered data into the tree
-        for values in filtered_data:
-            anime_entry = values[-1]  # Last element is the anime entry
-            
-            # Determine if anime should be colored based on its status
-            tags = []
-            anime_id = anime_entry.get('anime', {}).get('id')
-            
-            if anime_id and hasattr(self.main_window, 'anime_matcher'):
-                detailed_cache = getattr(self.main_window.anime_matcher, 'detailed_anime_cache', {})
-                
-                if anime_id in detailed_cache:
-                    anime_status = detailed_cache[anime_id].get('status', '').lower()
-                    
-                    # Color anime that are not released (ongoing, announced, etc.)
-                    if anime_status and anime_status != 'released':
-                        tags.append('non_released')
-            
-            item_id = self.tree.insert("", tk.END, values=values[:-1], tags=tags)
-            self.item_data[item_id] = values[-1]
-            item_count += 1
+        # Tags are precomputed, redo them if the matcher loaded or dropped details since
+        detailed_cache = self._detailed_cache()
+        if self._tags_key != (id(detailed_cache), len(detailed_cache)):
+            self._tags_key = self._tag_rows(self._rows, detailed_cache)
         
-        # Count all other statuses for tab counters
-        for status_key, anime_list in self.anime_data.items():
-            if status_key not in status_counters:
-                filtered_count = self._count_filtered_anime(anime_list, search_filter, year_filter, type_filter, score_filter)
-                status_counters[status_key] = filtered_count
+        # Build the sorted and filtered rows for the tree
+        rows = []
+        for values in filtered_data:
+            row = values[-1]  # Last element is the precomputed row
+            # Rows are keyed by user rate id so they can be reused across repopulates
+            rows.append((row.iid, row.display, row.tags, row.entry))
         
-        # Update tab counters
-        self._update_tab_counters(status_counters)
-    
-    def _count_filtered_anime(self, anime_list, search_filter, year_filter, type_filter, score_filter):
-        """Count anime that match the current filters"""
-        count = 0
-        for anime_entry in anime_list:
-            anime = anime_entry.get('anime', {})
-            if not anime:
-                continue
-            
-            # Apply search filter
-            anime_name = anime.get('name', '')
-            if search_filter and search_filter not in anime_name.lower():
-                continue
-            
-            # Apply year filter
-            aired_on = anime.get('aired_on', '')
-            year = aired_on[:4] if aired_on else '-'
-            if year_filter != "All" and year != year_filter:
-                continue
-            
-            # Apply type filter
-            anime_type = anime.get('kind', '').upper()
-            if type_filter != "All" and anime_type != type_filter:
-                continue
-            
-            # Apply score filter
-            score = anime_entry.get('score', 0) or 0
-            if score_filter != "All":
-                if score_filter == "Not Scored":
-                    if score > 0:
-                        continue
-                else:
-                    try:
-                        score_threshold = int(score_filter[0])
-                        if score_threshold and score < score_threshold:
-                            continue
-                    except (ValueError, IndexError):
-                        continue
-            
-            count += 1
-        return count
+        # Only a window of the rows goes into the tree, see _on_yscroll
+        self._view_rows = rows
+        self._schedule_render()
     
     def _update_tab_counters(self, status_counters):
         """Update the counter display on each tab"""
         status_order = ['watching', 'planned', 'completed', 'on_hold', 'dropped', 'rewatching']
+        statuses = self.main_window.get_shikimori_client().STATUSES
         
         for i, status in enumerate(status_order):
-            count = status_counters.get(status, 0)
-            status_display = self.main_window.get_shikimori_client().STATUSES.get(status, status)
+            count = status_counters.get(status)
+            # Not counted yet, or the label already shows this count
+            if count is None or self.tab_counters.get(status) == count:
+                continue
+            self.tab_counters[status] = count
+            status_display = statuses.get(status, status)
             self.status_tabs.tab(i, text=f"{status_display} [{count}]")
     
     def _get_selected_anime(self) -> Optional[Dict[str, Any]]:
@@ -730,6 +943,8 @@ class AnimeListFrame(ttk.Frame):
 class AnimeEditDialog:
     """Dialog for editing anime details"""
     
+    _inflight_updates = set()  # Rate ids with a save still in progress
+    
     def __init__(self, parent, anime_entry: Dict[str, Any], main_window):
         self.parent = parent
         self.anime_entry = anime_entry
@@ -765,6 +980,8 @@ class AnimeEditDialog:
         main_frame.pack(fill=tk.BOTH, expand=True)
         
         anime = self.anime_entry['anime']
+        client = self.main_window.get_shikimori_client()
+        statuses = client.STATUSES
         
         # Anime name (read-only)
         ttk.Label(main_frame, text="Anime:").grid(row=0, column=0, sticky=tk.W, pady=(0, 5))
@@ -775,14 +992,14 @@ class AnimeEditDialog:
         ttk.Label(main_frame, text="Status:").grid(row=1, column=0, sticky=tk.W, pady=5)
         self.status_var = tk.StringVar()
         status_combo = ttk.Combobox(main_frame, textvariable=self.status_var,
-                                   values=list(self.main_window.get_shikimori_client().STATUSES.values()),
+                                   values=client.STATUS_DISPLAY_VALUES,
                                    state="readonly", width=20)
         status_combo.grid(row=1, column=1, sticky=tk.W, pady=5)
         
         # Set current status
         current_status = self.anime_entry.get('status', '')
-        if current_status in self.main_window.get_shikimori_client().STATUSES:
-            self.status_var.set(self.main_window.get_shikimori_client().STATUSES[current_status])
+        if current_status in statuses:
+            self.status_var.set(statuses[current_status])
         
         # Episodes
         ttk.Label(main_frame, text="Episodes:").grid(row=2, column=0, sticky=tk.W, pady=5)
@@ -823,8 +1040,7 @@ class AnimeEditDialog:
         new_score = self.score_var.get()
         
         # Convert status display back to API key
-        status_map = {v: k for k, v in self.main_window.get_shikimori_client().STATUSES.items()}
-        new_status = status_map.get(new_status_display)
+        new_status = self.main_window.get_shikimori_client().STATUSES_INV.get(new_status_display)
         
         # Check for changes
         current_status = self.anime_entry.get('status', '')
@@ -843,27 +1059,28 @@ class AnimeEditDialog:
             self.dialog.destroy()
             return
         
-        # Apply updates
-        def update_anime():
-            try:
-                rate_id = self.anime_entry['id']
-                success = self.main_window.get_shikimori_client().update_anime_progress(
-                    rate_id, **updates)
-                
-                if success:
-                    self.changes_made = True
-                    # Update cache directly and reload from cache
-                    anime_id = self.anime_entry['id']
-                    self.dialog.after(0, lambda: self.parent.main_window._update_cache_and_reload(anime_id, updates))
-                    self.dialog.after(0, self.dialog.destroy)
-                else:
-                    self.dialog.after(0, lambda: messagebox.showerror("Error", "Failed to update anime"))
-                    
-            except Exception as e:
-                self.dialog.after(0, lambda: messagebox.showerror("Error", f"Error updating anime: {str(e)}"))
+        # Ignore repeated Save clicks while this entry's edit is queued or being sent
+        rate_id = self.anime_entry['id']
+        if rate_id in self._inflight_updates:
+            return
+        self._inflight_updates.add(rate_id)
         
-        threading.Thread(target=update_anime, daemon=True).start()
-
+        # Sent by the main window, which merges quick successive edits into one request
+        self.main_window.queue_update(rate_id, updates,
+                                      on_success=self._on_update_success,
+                                      on_error=self._on_update_error)
+    
+    def _on_update_success(self):
+        """Close the dialog once the edit is saved (the main window updates the cache and row)"""
+        self._inflight_updates.discard(self.anime_entry['id'])
+        self.changes_made = True
+        if self.dialog.winfo_exists():
+            self.dialog.destroy()
+    
+    def _on_update_error(self, message: str):
+        """Report a failed save and keep the dialog open"""
+        self._inflight_updates.discard(self.anime_entry['id'])
+        messagebox.showerror("Error", message)
 
 class CommentDialog:
     """Dialog for adding/editing comments"""
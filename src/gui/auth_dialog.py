@@ -6,12 +6,35 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import webbrowser
 import urllib.parse
-import threading
 import http.server
 import socketserver
 import socket
 from gui.modern_style import ModernStyle
 from utils.logger import get_logger
+from utils.io_pool import IO_POOL
+
+# Setup steps shown at the top of the dialog
+_INSTRUCTIONS = """To use this application, you need to create a Shikimori API application.
+
+Follow these steps:
+
+1. Go to https://shikimori.one/oauth/applications
+
+2. Click 'New Application'
+
+3. Fill in the form with these EXACT details:
+   • Name: Shikimori Updater (or any name you prefer)
+   • Redirect URI: http://localhost:8080/callback
+     ⚠️  CRITICAL: Must be exactly this URL, no variations!
+   • Scopes: user_rates
+     ⚠️  CRITICAL: Must include this scope for the app to work!
+
+4. Save the application and copy the Client ID and Client Secret below
+   • Client ID: Long string of letters/numbers
+   • Client Secret: Long string of letters/numbers
+   ⚠️  Copy these EXACTLY as shown, no extra spaces!
+
+5. Click 'Start Authorization' to begin the OAuth process"""
 
 class AuthDialog:
     """Dialog for Shikimori authentication setup"""
@@ -23,19 +46,17 @@ class AuthDialog:
         
         self.dialog = tk.Toplevel(parent)
         self.dialog.title("Shikimori Authentication")
-        self.dialog.geometry("600x790")
+        
+        # Center dialog on the screen, only the screen size is needed so no layout pass
+        x = (self.dialog.winfo_screenwidth() - 600) // 2
+        y = (self.dialog.winfo_screenheight() - 790) // 2
+        self.dialog.geometry(f"600x790+{x}+{y}")
         self.dialog.resizable(True, True)
         
         # Make dialog modal
         self.dialog.transient(parent)
         self.dialog.grab_set()
         
-        # Center dialog
-        self.dialog.update_idletasks()
-        x = (self.dialog.winfo_screenwidth() - 600) // 2
-        y = (self.dialog.winfo_screenheight() - 790) // 2
-        self.dialog.geometry(f"600x790+{x}+{y}")
-        
         # Apply modern styling
         dark_theme = config.get('ui.dark_theme', False)
         self.modern_style = ModernStyle(self.dialog, dark_theme=dark_theme)
@@ -68,18 +89,18 @@ class AuthDialog:
         except:
             bg_color = self.dialog.cget('bg')
         
-        # Apply theming to text widget
-        text_bg = self.modern_style.get_color('bg_card')
-        text_fg = self.modern_style.get_color('text_primary')
+        # Apply theming to text widget, palette read once
+        colors = self.modern_style.COLORS
+        text_fg = colors['text_primary']
         
         instructions_text = tk.Text(instructions_frame, height=12, wrap=tk.WORD, 
                                   font=("Segoe UI", 9), relief=tk.FLAT, 
-                                  background=text_bg,
+                                  background=colors['bg_card'],
                                   foreground=text_fg,
-                                  selectbackground=self.modern_style.get_color('accent'),
-                                  selectforeground=self.modern_style.get_color('text_white'),
+                                  selectbackground=colors['accent'],
+                                  selectforeground=colors['text_white'],
                                   insertbackground=text_fg,
-                                  state=tk.DISABLED, cursor="arrow")
+                                  cursor="arrow")
         
         # Add scrollbar
         scrollbar = ttk.Scrollbar(instructions_frame, orient=tk.VERTICAL, command=instructions_text.yview)
@@ -89,31 +110,8 @@ class AuthDialog:
         instructions_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
-        # Insert instructions text
-        instructions_content = """To use this application, you need to create a Shikimori API application.
-
-Follow these steps:
-
-1. Go to https://shikimori.one/oauth/applications
-
-2. Click 'New Application'
-
-3. Fill in the form with these EXACT details:
-   • Name: Shikimori Updater (or any name you prefer)
-   • Redirect URI: http://localhost:8080/callback
-     ⚠️  CRITICAL: Must be exactly this URL, no variations!
-   • Scopes: user_rates
-     ⚠️  CRITICAL: Must include this scope for the app to work!
-
-4. Save the application and copy the Client ID and Client Secret below
-   • Client ID: Long string of letters/numbers
-   • Client Secret: Long string of letters/numbers
-   ⚠️  Copy these EXACTLY as shown, no extra spaces!
-
-5. Click 'Start Authorization' to begin the OAuth process"""
-        
-        instructions_text.config(state=tk.NORMAL)
-        instructions_text.insert(tk.END, instructions_content)
+        # Insert instructions text, the widget stays read-only afterwards
+        instructions_text.insert('1.0', _INSTRUCTIONS)
         instructions_text.config(state=tk.DISABLED)
         
         # Open browser button
@@ -242,19 +240,12 @@ Follow these steps:
                 # Clean the auth code - remove any whitespace or URL encoding
                 clean_code = auth_code.strip()
                 
-                # If user pasted the full URL, extract just the code
-                if "code=" in clean_code:
-                    # Extract code from URL
-                    parsed = urllib.parse.urlparse(clean_code)
-                    query_params = urllib.parse.parse_qs(parsed.query)
-                    if 'code' in query_params:
-                        clean_code = query_params['code'][0]
-                    else:
-                        # Try to find code in the URL string
-                        import re
-                        code_match = re.search(r'code=([^&]+)', clean_code)
-                        if code_match:
-                            clean_code = code_match.group(1)
+                # If user pasted the full URL, extract just the code (up to the next parameter)
+                start = clean_code.find('code=')
+                if start != -1:
+                    start += len('code=')
+                    end = clean_code.find('&', start)
+                    clean_code = clean_code[start:end] if end != -1 else clean_code[start:]
                 
                 # URL decode the code in case it's encoded
                 clean_code = urllib.parse.unquote(clean_code)
@@ -318,7 +309,7 @@ Follow these steps:
                 self.dialog.after(0, lambda: messagebox.showerror(error_title, 
                     f"Error: {error_msg}\n\n{troubleshooting}"))
         
-        threading.Thread(target=exchange_code, daemon=True).start()
+        IO_POOL.submit(exchange_code)
     
     def _save_and_close(self):
         """Save settings and close dialog"""
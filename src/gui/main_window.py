@@ -10,23 +10,30 @@ except ImportError:
     import tkinter.simpledialog as simpledialog
 import threading
 import webbrowser
+from concurrent.futures import ThreadPoolExecutor, wait
+from functools import partial
 import os
 import sys
-from typing import Dict, List, Any, Optional
-try:
-    import pystray
-    from PIL import Image, ImageDraw
-    # Test that pystray can be initialized
-    test_image = Image.new('RGB', (16, 16), 'black')
-    test_icon = pystray.Icon('test', test_image)
-    TRAY_AVAILABLE = True
-    # Will log when logger is available
-except ImportError as e:
-    # Will log when logger is available
-    TRAY_AVAILABLE = False
-except Exception as e:
-    # Will log when logger is available
-    TRAY_AVAILABLE = False
+import importlib.util
+from typing import Dict, List, Any, Optional, Callable, Tuple
+
+# Only check that pystray and PIL are installed, _try_import_tray imports them
+# when the tray is first set up
+TRAY_AVAILABLE = bool(importlib.util.find_spec('pystray') and importlib.util.find_spec('PIL'))
+_tray_modules = None
+
+def _try_import_tray():
+    """Import the tray dependencies once, returning (pystray, Image, ImageDraw) or None"""
+    global TRAY_AVAILABLE, _tray_modules
+    if _tray_modules is None and TRAY_AVAILABLE:
+        try:
+            import pystray
+            from PIL import Image, ImageDraw
+            _tray_modules = (pystray, Image, ImageDraw)
+        except Exception:
+            _tray_modules = ()
+        TRAY_AVAILABLE = bool(_tray_modules)
+    return _tray_modules or None
 
 from api.shikimori_client import ShikimoriClient
 from api.api_server import APIServer
@@ -35,12 +42,11 @@ from utils.anime_matcher import AnimeMatcher
 from utils.enhanced_anime_matcher import EnhancedAnimeMatcher
 from gui.simple_auth_dialog import SimpleAuthDialog
 from gui.anime_list_frame import AnimeListFrame
-from gui.manga_list_frame import MangaListFrame
-from gui.search_frame import SearchFrame
 from gui.options_dialog import OptionsDialog
 from gui.modern_style import ModernStyle
 from core.cache import CacheManager
 from utils.logger import get_logger
+from utils.io_pool import IO_POOL
 from utils.updater import UpdateChecker
 from utils.version import get_version_info
 from gui.update_dialog import UpdateNotification
@@ -48,6 +54,9 @@ from gui.update_dialog import UpdateNotification
 class MainWindow:
     """Main application window"""
     
+    UPDATE_COALESCE_MS = 250  # Edits to one entry within this window go out as one request
+    CLOSE_UPDATE_TIMEOUT = 10  # Longest the close waits for edits already being sent
+    
     def __init__(self, root: tk.Tk, config):
         self.root = root
         self.config = config
@@ -58,24 +67,28 @@ class MainWindow:
         # Use enhanced matcher with synonym support
         self.anime_matcher = EnhancedAnimeMatcher(self.shikimori, self.cache_manager)
         
-        # Initialize notification manager
-        from utils.notification_manager import NotificationManager
-        self.notification_manager = NotificationManager(config, self.shikimori, self.cache_manager)
-        
-        # Initialize Telegram notifier
-        from utils.telegram_notifier import TelegramNotifier
-        self.telegram_notifier = TelegramNotifier(config)
+        # Notification manager and Telegram notifier are created on first use
+        self._notification_manager = None
+        self._telegram_notifier = None
         
         # Data
         self.current_user = None
         self.anime_list_data: Dict[str, List[Dict[str, Any]]] = {}
         self.manga_list_data: Dict[str, List[Dict[str, Any]]] = {}
+        self._all_anime_flat: List[Dict[str, Any]] = []  # anime_list_data flattened for matching
+        self._name_index: Optional[Dict[str, List[Dict[str, Any]]]] = None  # Cleaned name -> entries
+        self._name_index_key = None  # Detailed cache the index was built against
         self.monitoring_active = False
         self.tray_icon = None
         self.window_minimized = False
         self.updated_anime_episodes = set()  # Track which anime episodes have been updated
         self.browser_watched_episodes = {}  # Track browser episodes with start times: {unique_key: start_time}
         self.browser_pending_timers = {}  # Track pending timer callbacks: {unique_key: timer_id}
+        self._pending_updates: Dict[int, Dict[str, Any]] = {}  # Queued list edits by rate id
+        self._pending_callbacks: Dict[int, List[Tuple[Optional[Callable], Optional[Callable]]]] = {}
+        self._pending_timer = None
+        self._sending_updates: Dict[Any, Tuple[int, Dict[str, Any]]] = {}  # future -> (rate id, updates)
+        self._closing = False
         
         # Update check timer
         self.update_check_timer = None
@@ -147,12 +160,8 @@ class MainWindow:
                         del self.browser_watched_episodes[current_episode_key]
                     
                     # Find matching anime in user's list
-                    all_anime = []
-                    for anime_list in self.anime_list_data.values():
-                        all_anime.extend(anime_list)
-                    
                     self.logger.debug(f"Searching for anime match: {title}")
-                    match_result = self.anime_matcher.find_best_match(title, all_anime, episode)
+                    match_result = self._match_anime(title, episode)
                     
                     if match_result:
                         anime_entry, similarity = match_result
@@ -393,9 +402,9 @@ class MainWindow:
         # Apply title bar theme after window is fully set up
         self.root.after(100, self.modern_style._apply_title_bar_theme)
         
-        # Initialize system tray if available
+        # Initialize system tray if available, once the window has painted
         if TRAY_AVAILABLE:
-            self._setup_system_tray()
+            self.root.after(500, self._setup_system_tray)
     
     def _set_window_icon(self):
         """Set the window icon"""
@@ -452,6 +461,8 @@ class MainWindow:
     def _load_tray_icon(self):
         """Load custom icon for system tray"""
         try:
+            from PIL import Image
+            
             # Try to find icon file in different locations
             icon_paths = [
                 'icon.png',
@@ -638,7 +649,7 @@ class MainWindow:
 
         self.compact_status_var = tk.StringVar(value="-")
         self.compact_status_combo = ttk.Combobox(status_frame, textvariable=self.compact_status_var,
-                                                values=["-"] + list(self.shikimori.STATUSES.values()),
+                                                values=("-",) + self.shikimori.STATUS_DISPLAY_VALUES,
                                                 width=12, state="readonly")
         self.compact_status_combo.pack(side=tk.LEFT)
         self.compact_status_combo.bind('<<ComboboxSelected>>', self._on_compact_status_changed)
@@ -782,13 +793,52 @@ class MainWindow:
         self.anime_list_frame = AnimeListFrame(self.notebook, self)
         self.notebook.add(self.anime_list_frame, text="Anime List")
         
-        # Manga List tab
-        self.manga_list_frame = MangaListFrame(self.notebook, self)
-        self.notebook.add(self.manga_list_frame, text="Manga List")
+        # Manga List and Search tabs start as placeholders, built when first selected
+        self.manga_list_frame = None
+        self.search_frame = None
+        self._tab_built = {'manga': False, 'search': False}
+        self._tab_placeholders = {}
+        for key, text in (('manga', "Manga List"), ('search', "Search & Add")):
+            placeholder = ttk.Frame(self.notebook)
+            self.notebook.add(placeholder, text=text)
+            self._tab_placeholders[key] = placeholder
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_notebook_tab_changed)
+    
+    def _on_notebook_tab_changed(self, event=None):
+        """Build a placeholder tab's real frame the first time it is selected"""
+        selected = self.notebook.select()
+        for key, placeholder in self._tab_placeholders.items():
+            if not self._tab_built[key] and str(placeholder) == selected:
+                self._build_tab(key)
+                break
+    
+    def _build_tab(self, key: str):
+        """Replace a placeholder tab with its frame, at the same position"""
+        placeholder = self._tab_placeholders[key]
+        index = self.notebook.index(placeholder)
+        text = self.notebook.tab(placeholder, 'text')
         
-        # Search tab
-        self.search_frame = SearchFrame(self.notebook, self)
-        self.notebook.add(self.search_frame, text="Search & Add")
+        if key == 'manga':
+            from gui.manga_list_frame import MangaListFrame
+            frame = self.manga_list_frame = MangaListFrame(self.notebook, self)
+        else:
+            from gui.search_frame import SearchFrame
+            frame = self.search_frame = SearchFrame(self.notebook, self)
+        self._tab_built[key] = True
+        
+        self.notebook.forget(placeholder)
+        placeholder.destroy()
+        self.notebook.insert(index, frame, text=text)
+        self.notebook.select(frame)
+        
+        # Manga data may have been loaded before the tab existed
+        if key == 'manga':
+            self._update_manga_frame()
+    
+    def _update_manga_frame(self):
+        """Show the current manga list data, if the manga tab has been built"""
+        if self.manga_list_frame is not None:
+            self.manga_list_frame.update_list(self.manga_list_data)
     
     def _setup_monitoring(self):
         """Setup player monitoring callbacks"""
@@ -830,6 +880,7 @@ class MainWindow:
         
         self.current_user = None
         self.anime_list_data.clear()
+        self._invalidate_name_index()
         
         self._update_auth_ui()
         self.anime_list_frame.clear_list()
@@ -908,6 +959,7 @@ class MainWindow:
                 
                 if cached_data:
                     self.anime_list_data = cached_data
+                    self._invalidate_name_index()
                     total_anime = sum(len(anime_list) for anime_list in cached_data.values())
                     
                     # Update UI on main thread
@@ -951,6 +1003,7 @@ class MainWindow:
                     self.anime_matcher.set_cache_updated_callback(self._on_detailed_cache_updated)
                     # Start periodic updater for non-released anime
                     self.anime_matcher.start_periodic_updater(self.current_user['id'])
+                self._rebuild_name_index()
                 return
         
         # Load from API if no cache or forced refresh
@@ -958,18 +1011,23 @@ class MainWindow:
         
         total_anime = 0
         
-        # Load all statuses
-        for i, status_key in enumerate(self.shikimori.STATUSES.keys()):
-            status_display = self.shikimori.STATUSES[status_key]
-            self.root.after(0, lambda s=status_display: self._set_status(f"Loading {s} anime..."))
+        # Load all statuses at once, the client's rate limiter paces the requests
+        statuses = self.shikimori.STATUSES
+        with ThreadPoolExecutor(max_workers=len(statuses)) as executor:
+            futures = {status_key: executor.submit(self.shikimori.get_user_anime_list, user_id, status_key)
+                       for status_key in statuses}
             
-            anime_list = self.shikimori.get_user_anime_list(user_id, status_key)
-            self.anime_list_data[status_key] = anime_list
-            total_anime += len(anime_list)
-            
-            # Update progress
-            progress = f"Loaded {total_anime} anime so far..."
-            self.root.after(0, lambda p=progress: self._set_status(p))
+            for status_key, future in futures.items():
+                status_display = statuses[status_key]
+                self.root.after(0, lambda s=status_display: self._set_status(f"Loading {s} anime..."))
+                
+                anime_list = future.result()
+                self.anime_list_data[status_key] = anime_list
+                total_anime += len(anime_list)
+                
+                # Update progress
+                progress = f"Loaded {total_anime} anime so far..."
+                self.root.after(0, lambda p=progress: self._set_status(p))
         
         # Save to cache
         self.cache_manager.save_anime_list(user_id, self.anime_list_data)
@@ -991,6 +1049,7 @@ class MainWindow:
             self.anime_matcher.set_cache_updated_callback(self._on_detailed_cache_updated)
             # Start periodic updater for non-released anime
             self.anime_matcher.start_periodic_updater(self.current_user['id'])
+        self._rebuild_name_index()
     
     def _update_auth_ui(self):
         """Update authentication UI elements"""
@@ -1040,6 +1099,7 @@ class MainWindow:
     
     def _on_detailed_cache_updated(self):
         """Called when the detailed anime cache is updated by the periodic updater"""
+        self._invalidate_name_index()
         # Schedule UI refresh on the main thread
         self.root.after(0, lambda: self.anime_list_frame.update_list(self.anime_list_data))
         self.root.after(0, lambda: self._set_status("Anime status highlighting updated"))
@@ -1065,13 +1125,8 @@ class MainWindow:
         def process_episode():
             try:
                 # Find matching anime in user's list
-                all_anime = []
-                for anime_list in self.anime_list_data.values():
-                    all_anime.extend(anime_list)
-                
                 self.logger.debug(f"Searching for anime match: {episode_info.anime_name}")
-                match_result = self.anime_matcher.find_best_match(
-                    episode_info.anime_name, all_anime, episode_info.episode_number)
+                match_result = self._match_anime(episode_info.anime_name, episode_info.episode_number)
                 
                 if match_result:
                     anime_entry, similarity = match_result
@@ -1208,14 +1263,35 @@ class MainWindow:
         if not self.anime_list_data:
             return False
         
-        # Get all anime from user's list
-        all_anime = []
-        for anime_list in self.anime_list_data.values():
-            all_anime.extend(anime_list)
-        
         # Use anime matcher to find if there's a match
-        match_result = self.anime_matcher.find_best_match(anime_name, all_anime)
-        return match_result is not None
+        return self._match_anime(anime_name) is not None
+    
+    def _rebuild_name_index(self):
+        """Flatten the anime list and index it by cleaned names and synonyms"""
+        detailed_cache = self.anime_matcher.detailed_anime_cache
+        all_anime = [entry for anime_list in self.anime_list_data.values() for entry in anime_list]
+        name_index = self.anime_matcher.build_name_index(all_anime)
+        self._all_anime_flat = all_anime
+        self._name_index = name_index
+        self._name_index_key = (id(detailed_cache), len(detailed_cache))
+        return all_anime, name_index
+    
+    def _invalidate_name_index(self):
+        """Drop the name index after entries were added, removed or moved"""
+        self._name_index = None
+    
+    def _match_anime(self, anime_name: str, episode_number: int = None):
+        """Find the list entry for a detected title, exact name lookup before fuzzy matching"""
+        all_anime, name_index = self._all_anime_flat, self._name_index
+        detailed_cache = self.anime_matcher.detailed_anime_cache
+        # Synonyms fetched in the background change what the index should hold
+        if name_index is None or self._name_index_key != (id(detailed_cache), len(detailed_cache)):
+            all_anime, name_index = self._rebuild_name_index()
+        
+        match_result = self.anime_matcher.find_exact_match(anime_name, name_index, episode_number)
+        if match_result:
+            return match_result
+        return self.anime_matcher.find_best_match(anime_name, all_anime, episode_number)
     
     def _on_player_closed(self):
         """Handle when player is closed - clear the monitoring panel"""
@@ -1260,13 +1336,21 @@ class MainWindow:
             self.player_monitor.stop_monitoring()
         
         # Stop notification monitoring
-        if hasattr(self, 'notification_manager'):
-            self.notification_manager.stop_monitoring()
+        if self._notification_manager is not None:
+            self._notification_manager.stop_monitoring()
         
         # Stop periodic updater
         if hasattr(self, 'anime_matcher'):
             self.anime_matcher.stop_periodic_updater()
         
+        # Finish queued and in-flight list edits so the cache written below has them
+        self._closing = True
+        self._finish_updates_on_close()
+        
+        # Write out pending cache updates
+        if hasattr(self, 'cache_manager'):
+            self.cache_manager.flush()
+        
         # Stop API server
         if hasattr(self, 'api_server') and self.api_server:
             self.api_server.stop()
@@ -1283,6 +1367,22 @@ class MainWindow:
         
         self.root.destroy()
     
+    @property
+    def notification_manager(self):
+        """Notification manager, imported and created on first use"""
+        if self._notification_manager is None:
+            from utils.notification_manager import NotificationManager
+            self._notification_manager = NotificationManager(self.config, self.shikimori, self.cache_manager)
+        return self._notification_manager
+    
+    @property
+    def telegram_notifier(self):
+        """Telegram notifier, imported and created on first use"""
+        if self._telegram_notifier is None:
+            from utils.telegram_notifier import TelegramNotifier
+            self._telegram_notifier = TelegramNotifier(self.config)
+        return self._telegram_notifier
+    
     # Public methods for other components
     def get_shikimori_client(self) -> ShikimoriClient:
         """Get Shikimori client instance"""
@@ -1690,8 +1790,7 @@ class MainWindow:
             return
         
         # Convert status display back to API key
-        status_map = {v: k for k, v in self.shikimori.STATUSES.items()}
-        new_status_key = status_map.get(status_text)
+        new_status_key = self.shikimori.STATUSES_INV.get(status_text)
         
         if new_status_key:
             self._update_status(new_status_key)
@@ -1786,28 +1885,144 @@ class MainWindow:
         threading.Thread(target=add_and_reload, daemon=True).start()
     
     def _update_cache_and_reload(self, anime_id: int, updates: Dict[str, Any]):
-        """Update cache directly and reload from cache to reflect changes"""
-        def update_and_reload():
-            if self.current_user:
-                user_id = self.current_user['id']
-                # Update the cache file directly
-                cache_updated = self.cache_manager.update_anime_in_cache(user_id, anime_id, updates)
-                
-                if cache_updated:
-                    # Reload from updated cache
-                    self.root.after(0, self._reload_from_cache)
-                else:
-                    # Fallback to full refresh if cache update failed
-                    self.root.after(0, lambda: self._refresh_list(force_refresh=True))
+        """Update cache directly and refresh the edited row to reflect changes"""
+        # The cache shares its lists with the UI, so patch them on the Tk thread
+        self.root.after(0, self._apply_update, anime_id, updates)
+    
+    def _apply_update(self, anime_id: int, updates: Dict[str, Any]):
+        """Patch the cache and redraw the edited row (Tk thread)"""
+        if not self.current_user:
+            return
+        if self._patch_cache(anime_id, updates):
+            # Only the edited entry changed, no need to reload the whole list
+            self._refresh_row(anime_id, updates)
+        else:
+            # Fallback to full refresh if cache update failed
+            self._refresh_list(True)
+    
+    def queue_update(self, rate_id: int, updates: Dict[str, Any],
+                     on_success: Optional[Callable] = None, on_error: Optional[Callable] = None):
+        """Queue a list edit, merging it with other edits to the same entry
+        
+        on_success() or on_error(message) runs on the Tk thread once the merged request finishes.
+        """
+        self._pending_updates.setdefault(rate_id, {}).update(updates)
+        if on_success or on_error:
+            self._pending_callbacks.setdefault(rate_id, []).append((on_success, on_error))
+        if self._pending_timer is not None:
+            self.root.after_cancel(self._pending_timer)
+        self._pending_timer = self.root.after(self.UPDATE_COALESCE_MS, self._flush_updates)
+    
+    def _flush_updates(self):
+        """Send one update request per queued entry"""
+        if self._pending_timer is not None:
+            self.root.after_cancel(self._pending_timer)
+            self._pending_timer = None
+        pending, self._pending_updates = self._pending_updates, {}
+        callbacks, self._pending_callbacks = self._pending_callbacks, {}
+        for rate_id, updates in pending.items():
+            future = IO_POOL.submit(self._send_update, rate_id, updates)
+            self._sending_updates[future] = (rate_id, updates)
+            future.add_done_callback(partial(self._on_update_sent, callbacks.get(rate_id, ())))
+    
+    def _send_update(self, rate_id: int, updates: Dict[str, Any]) -> Optional[str]:
+        """Send an edit to Shikimori, returns an error message or None on success"""
+        try:
+            if self.shikimori.update_anime_progress(rate_id, **updates):
+                return None
+            return "Failed to update anime"
+        except Exception as e:
+            self.logger.error(f"Error updating anime {rate_id}: {e}")
+            return f"Error updating anime: {str(e)}"
+    
+    def _on_update_sent(self, callbacks, future):
+        """Post a finished edit back to the Tk thread (worker thread)"""
+        if self._closing:
+            return  # _finish_updates_on_close applies it instead
+        # after() passes the arguments on, no closures needed
+        self.root.after(0, self._finish_update, future, callbacks)
+    
+    def _finish_update(self, future, callbacks):
+        """Apply a finished edit and report the result to whoever queued it"""
+        if future not in self._sending_updates:
+            return
+        rate_id, updates = self._sending_updates.pop(future)
+        error = future.result()
+        if error is None:
+            self._apply_update(rate_id, updates)
+            for on_success, _on_error in callbacks:
+                if on_success:
+                    on_success()
+            return
         
-        threading.Thread(target=update_and_reload, daemon=True).start()
+        error_handlers = [on_error for _on_success, on_error in callbacks if on_error]
+        if not error_handlers:
+            messagebox.showerror("Error", error)
+        for on_error in error_handlers:
+            on_error(error)
+    
+    def _finish_updates_on_close(self):
+        """Wait for edits in flight, send queued ones synchronously and patch the cache with them"""
+        if self._pending_timer is not None:
+            self.root.after_cancel(self._pending_timer)
+            self._pending_timer = None
+        
+        # Requests already sent go first, queued edits to the same entry are newer
+        results = []
+        if self._sending_updates:
+            done, not_done = wait(list(self._sending_updates), timeout=self.CLOSE_UPDATE_TIMEOUT)
+            for future in done:
+                rate_id, updates = self._sending_updates[future]
+                results.append((rate_id, updates, future.result()))
+            if not_done:
+                self.logger.warning(f"{len(not_done)} list edits were still being sent on close")
+            self._sending_updates.clear()
+        
+        pending, self._pending_updates = self._pending_updates, {}
+        self._pending_callbacks.clear()
+        for rate_id, updates in pending.items():
+            results.append((rate_id, updates, self._send_update(rate_id, updates)))
+        
+        for rate_id, updates, error in results:
+            if error is None:
+                self._patch_cache(rate_id, updates)
+            else:
+                self.logger.error(f"List edit for anime {rate_id} failed on close: {error}")
+    
+    def _patch_cache(self, anime_id: int, updates: Dict[str, Any]) -> bool:
+        """Apply updates to the single cached entry"""
+        if not self.current_user:
+            return False
+        return self.cache_manager.update_anime_in_cache(self.current_user['id'], anime_id, updates)
+    
+    def _refresh_row(self, anime_id: int, updates: Dict[str, Any]):
+        """Apply updates to the shown list data and redraw just that entry"""
+        # The cache keeps its own copy of the entries, _patch_cache updated that one
+        for status_key, anime_list in self.anime_list_data.items():
+            for i, entry in enumerate(anime_list):
+                if entry.get('id') == anime_id:
+                    entry.update(updates)
+                    new_status = entry.get('status', status_key)
+                    if new_status != status_key:
+                        anime_list.pop(i)
+                        self.anime_list_data.setdefault(new_status, []).append(entry)
+                        self._invalidate_name_index()
+                    self.anime_list_frame.refresh_entry(anime_id)
+                    return
+        
+        # Not in the shown list, fall back to reloading it
+        self._reload_from_cache()
     
     
     def _setup_system_tray(self):
         """Setup system tray icon and menu"""
-        if not TRAY_AVAILABLE:
+        if self.tray_icon is not None:
+            return  # Already set up early by _hide_to_tray
+        tray_modules = _try_import_tray()
+        if not tray_modules:
             print("System tray not available - skipping setup")
             return
+        pystray, Image, ImageDraw = tray_modules
         
         try:
             # Try to load custom icon first
@@ -1890,6 +2105,9 @@ class MainWindow:
             print("Cannot hide to tray - functionality not available")
             return
         
+        if not self.tray_icon:
+            # Hiding before the delayed setup ran
+            self._setup_system_tray()
         if not self.tray_icon:
             print("Cannot hide to tray - tray icon not initialized")
             return
@@ -2200,6 +2418,8 @@ class MainWindow:
                 break
         
         if found:
+            # The entry dict was replaced, the index still points at the old one
+            self._invalidate_name_index()
             # Update the UI display efficiently - only refresh the tree view
             self.anime_list_frame.update_list(self.anime_list_data)
             # Update the selected anime in the info panel if it's the same one
@@ -2299,7 +2519,7 @@ class MainWindow:
                 total_manga = sum(len(manga_list) for manga_list in cached_data.values())
                 
                 # Update UI on main thread
-                self.root.after(0, lambda: self.manga_list_frame.update_list(self.manga_list_data))
+                self.root.after(0, self._update_manga_frame)
                 self.root.after(0, lambda: self._set_status(f"Manga list loaded from cache - {total_manga} manga"))
                 return
         
@@ -2308,24 +2528,29 @@ class MainWindow:
         
         total_manga = 0
         
-        # Load all statuses (no rewatching status for manga)
-        for i, status_key in enumerate(self.shikimori.MANGA_STATUSES.keys()):
-            status_display = self.shikimori.MANGA_STATUSES[status_key]
-            self.root.after(0, lambda s=status_display: self._set_status(f"Loading {s} manga..."))
+        # Load all statuses (no rewatching status for manga) at once, the client's rate limiter paces the requests
+        statuses = self.shikimori.MANGA_STATUSES
+        with ThreadPoolExecutor(max_workers=len(statuses)) as executor:
+            futures = {status_key: executor.submit(self.shikimori.get_user_manga_list, user_id, status_key)
+                       for status_key in statuses}
             
-            manga_list = self.shikimori.get_user_manga_list(user_id, status_key)
-            self.manga_list_data[status_key] = manga_list
-            total_manga += len(manga_list)
-            
-            # Update progress
-            progress = f"Loaded {total_manga} manga so far..."
-            self.root.after(0, lambda p=progress: self._set_status(p))
+            for status_key, future in futures.items():
+                status_display = statuses[status_key]
+                self.root.after(0, lambda s=status_display: self._set_status(f"Loading {s} manga..."))
+                
+                manga_list = future.result()
+                self.manga_list_data[status_key] = manga_list
+                total_manga += len(manga_list)
+                
+                # Update progress
+                progress = f"Loaded {total_manga} manga so far..."
+                self.root.after(0, lambda p=progress: self._set_status(p))
         
         # Save to cache
         self.cache_manager.save_manga_list(user_id, self.manga_list_data)
         
         # Update UI on main thread
-        self.root.after(0, lambda: self.manga_list_frame.update_list(self.manga_list_data))
+        self.root.after(0, self._update_manga_frame)
         self.root.after(0, lambda: self._set_status(f"Manga list updated - {total_manga} manga loaded"))
     
     def _update_manga_cache_and_reload(self, manga_id: int, updates: Dict[str, Any]):
@@ -2360,7 +2585,7 @@ class MainWindow:
                     total_manga = sum(len(manga_list) for manga_list in cached_data.values())
                     
                     # Update UI on main thread
-                    self.root.after(0, lambda: self.manga_list_frame.update_list(self.manga_list_data))
+                    self.root.after(0, self._update_manga_frame)
                     self.root.after(0, lambda: self._set_status(f"Updated from manga cache - {total_manga} manga"))
                 else:
                     # Fallback to full refresh if cache not available
@@ -2400,7 +2625,7 @@ class MainWindow:
         self.compact_total_volumes_var.set(f"/{total_volumes if total_volumes else '?'}")
         
         # Update status combo values for manga
-        self.compact_status_combo.config(values=["-"] + list(self.shikimori.MANGA_STATUSES.values()))
+        self.compact_status_combo.config(values=("-",) + self.shikimori.MANGA_STATUS_DISPLAY_VALUES)
     
     def _switch_to_anime_mode(self):
         """Switch UI to anime mode - hide volumes, show episodes"""
@@ -2423,7 +2648,7 @@ class MainWindow:
         self.compact_total_volumes_var.set("/?")
         
         # Update status combo values for anime
-        self.compact_status_combo.config(values=["-"] + list(self.shikimori.STATUSES.values()))
+        self.compact_status_combo.config(values=("-",) + self.shikimori.STATUS_DISPLAY_VALUES)
     
     def _compact_decrease_progress(self):
         """Decrease progress by 1 (episodes for anime, chapters for manga)"""
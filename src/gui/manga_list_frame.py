@@ -11,6 +11,7 @@ except ImportError:
     import tkinter.simpledialog as simpledialog
 import threading
 import webbrowser
+from utils.io_pool import IO_POOL
 from typing import Dict, List, Any, Optional
 
 class MangaListFrame(ttk.Frame):
@@ -662,6 +663,8 @@ class MangaListFrame(ttk.Frame):
 class MangaEditDialog:
     """Dialog for editing manga details"""
     
+    _inflight_updates = set()  # Rate ids with a save still in progress
+    
     def __init__(self, parent, manga_entry: Dict[str, Any], main_window):
         self.parent = parent
         self.manga_entry = manga_entry
@@ -707,7 +710,7 @@ class MangaEditDialog:
         ttk.Label(main_frame, text="Status:").grid(row=1, column=0, sticky=tk.W, pady=5)
         self.status_var = tk.StringVar()
         status_combo = ttk.Combobox(main_frame, textvariable=self.status_var,
-                                   values=list(self.main_window.get_shikimori_client().MANGA_STATUSES.values()),
+                                   values=self.main_window.get_shikimori_client().MANGA_STATUS_DISPLAY_VALUES,
                                    state="readonly", width=20)
         status_combo.grid(row=1, column=1, sticky=tk.W, pady=5)
         
@@ -770,8 +773,7 @@ class MangaEditDialog:
         new_score = self.score_var.get()
         
         # Convert status display back to API key
-        status_map = {v: k for k, v in self.main_window.get_shikimori_client().MANGA_STATUSES.items()}
-        new_status = status_map.get(new_status_display)
+        new_status = self.main_window.get_shikimori_client().MANGA_STATUSES_INV.get(new_status_display)
         
         # Check what changed
         changes = {}
@@ -785,9 +787,14 @@ class MangaEditDialog:
             changes['status'] = new_status
         
         if changes:
+            # Ignore repeated Save clicks while this entry's request is running
+            rate_id = self.manga_entry['id']
+            if rate_id in self._inflight_updates:
+                return
+            self._inflight_updates.add(rate_id)
+            
             def update_manga():
                 try:
-                    rate_id = self.manga_entry['id']
                     manga_name = self.manga_entry['manga'].get('name', 'Unknown')
                     
                     success = self.main_window.get_shikimori_client().update_manga_progress(
@@ -799,17 +806,23 @@ class MangaEditDialog:
                         manga_id = self.manga_entry['id']
                         self.main_window._update_manga_cache_and_reload(manga_id, changes)
                         
-                        self.dialog.after(0, lambda: messagebox.showinfo("Success", f"'{manga_name}' updated successfully"))
-                        self.dialog.after(0, self.dialog.destroy)
+                        self.dialog.after(0, self._post_success, manga_name)
                     else:
-                        self.dialog.after(0, lambda: messagebox.showerror("Error", f"Failed to update '{manga_name}'"))
+                        self.dialog.after(0, messagebox.showerror, "Error", f"Failed to update '{manga_name}'")
                         
                 except Exception as e:
-                    self.dialog.after(0, lambda: messagebox.showerror("Error", f"Error updating manga: {str(e)}"))
+                    self.dialog.after(0, messagebox.showerror, "Error", f"Error updating manga: {str(e)}")
+                finally:
+                    self._inflight_updates.discard(rate_id)
             
-            threading.Thread(target=update_manga, daemon=True).start()
+            IO_POOL.submit(update_manga)
         else:
             self.dialog.destroy()
+    
+    def _post_success(self, manga_name: str):
+        """Confirm a successful save and close the dialog"""
+        messagebox.showinfo("Success", f"'{manga_name}' updated successfully")
+        self.dialog.destroy()
 
 
 class MangaCommentDialog:
@@ -85,7 +85,7 @@ class SearchFrame(ttk.Frame):
         
         self.status_var = tk.StringVar(value="Plan to Watch")
         status_combo = ttk.Combobox(add_frame, textvariable=self.status_var,
-                                   values=list(self.main_window.get_shikimori_client().STATUSES.values()),
+                                   values=self.main_window.get_shikimori_client().STATUS_DISPLAY_VALUES,
                                    state="readonly", width=15)
         status_combo.pack(side=tk.LEFT, padx=(0, 10))
         
@@ -224,8 +224,7 @@ class SearchFrame(ttk.Frame):
         
         # Get status to add as
         status_display = self.status_var.get()
-        status_map = {v: k for k, v in self.main_window.get_shikimori_client().STATUSES.items()}
-        status_key = status_map.get(status_display, 'planned')
+        status_key = self.main_window.get_shikimori_client().STATUSES_INV.get(status_display, 'planned')
         
         anime_name = anime_data.get('name', 'Unknown')
         anime_id = anime_data.get('id')
@@ -203,6 +203,31 @@ class EnhancedAnimeMatcher(AnimeMatcher):
         
         return None
     
+    def build_name_index(self, anime_list: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+        """Map every cleaned name and synonym to the list entries that carry it"""
+        name_index = {}
+        for anime_entry in anime_list:
+            anime = anime_entry.get('anime', {})
+            if not anime:
+                continue
+            for name in self._get_enhanced_anime_names(anime):
+                name_index.setdefault(name, []).append(anime_entry)
+        return name_index
+    
+    def find_exact_match(self, detected_name: str, name_index: Dict[str, List[Dict[str, Any]]],
+                         episode_number: int = None) -> Optional[Tuple[Dict[str, Any], float]]:
+        """Look the cleaned name up in a build_name_index result, same pick as find_best_match"""
+        if not detected_name:
+            return None
+        
+        for anime_entry in name_index.get(self._clean_name(detected_name), ()):
+            total_episodes = anime_entry['anime'].get('episodes', 0)
+            if episode_number is not None and total_episodes > 0 and episode_number > total_episodes:
+                continue
+            return (anime_entry, 1.0)
+        
+        return None
+    
     def _get_enhanced_anime_names(self, anime: Dict[str, Any]) -> List[str]:
         """Get all possible names including synonyms from detailed cache"""
         names = []
@@ -253,10 +278,7 @@ class EnhancedAnimeMatcher(AnimeMatcher):
         self.cache_loaded = False
         
         # Clear disk cache
-        import os
-        cache_file = os.path.join(self.cache_manager.cache_dir, f"anime_details_{user_id}.json")
-        if os.path.exists(cache_file):
-            os.remove(cache_file)
+        self.cache_manager.clear_detailed_anime_info(user_id)
         
         # Reinitialize
         self.initialize_detailed_cache(user_id, anime_list_data)
@@ -0,0 +1,32 @@
+"""
+JSON helpers that use orjson when it is installed
+Both paths work with UTF-8 bytes, so callers can skip the str round-trip
+"""
+
+import json
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+JSONDecodeError = orjson.JSONDecodeError if ORJSON_AVAILABLE else json.JSONDecodeError
+
+def dumps(obj, indent: bool = False) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes, compact unless indent is set"""
+    if ORJSON_AVAILABLE:
+        # Non-str keys (int ids) are written as strings, like the json module does
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+def loads(data):
+    """Parse JSON from bytes or str"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
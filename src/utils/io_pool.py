@@ -0,0 +1,11 @@
+"""
+Shared worker pool for one-shot Shikimori API calls made from the GUI
+"""
+
+import atexit
+from concurrent.futures import ThreadPoolExecutor
+
+# A few workers are enough, the client's rate limiter paces the requests anyway
+IO_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="shikimori-io")
+
+atexit.register(IO_POOL.shutdown, wait=False)
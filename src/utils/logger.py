@@ -16,7 +16,8 @@ class DateBasedFileHandler(logging.FileHandler):
         self.filename_prefix = filename_prefix
         self.current_date = datetime.now().date()
         self.baseFilename = self._get_log_filename()
-        super().__init__(self.baseFilename, encoding='utf-8')
+        # Defer opening the file until the first record is written
+        super().__init__(self.baseFilename, encoding='utf-8', delay=True)
 
     def _get_log_filename(self):
         return os.path.join(self.log_dir, f"{self.filename_prefix}_{self.current_date}.log")
@@ -67,6 +68,8 @@ class Logger:
         # Setup logger
         self.logger = logging.getLogger('ShikimoriUpdater')
         self.logger.setLevel(logging.DEBUG)
+        # Frozen builds have nothing on the root logger worth a second handler pass
+        self.logger.propagate = not getattr(sys, 'frozen', False)
         
         # Clear any existing handlers
         for handler in self.logger.handlers[:]:
@@ -99,10 +102,7 @@ class Logger:
             pass
         
         # Log startup
-        self.logger.info("=" * 50)
-        self.logger.info("Shikimori Updater started")
-        self.logger.info(f"Log file: {self.file_handler.baseFilename}")
-        self.logger.info("=" * 50)
+        self.logger.info("Shikimori Updater started, log file: %s", self.file_handler.baseFilename)
     
     def get_logger(self, name=None):
         """Get a logger instance"""
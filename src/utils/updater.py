@@ -19,6 +19,9 @@ from .logger import get_logger
 
 logger = get_logger('updater')
 
+# PyInstaller --onedir builds keep their runtime files in this folder next to the EXE
+RUNTIME_DIR_NAME = "_internal"
+
 class Updater:
     """Handles application updates from GitHub releases"""
     
@@ -200,6 +203,7 @@ class Updater:
                 # Try to find an existing compiled version in common locations
                 possible_locations = [
                     os.path.join(os.getcwd(), "Shikimori Updater.exe"),
+                    os.path.join(os.getcwd(), "dist", "Shikimori Updater", "Shikimori Updater.exe"),
                     os.path.join(os.getcwd(), "dist", "Shikimori Updater.exe"),
                     os.path.join(os.getcwd(), "build", "Shikimori Updater.exe"),
                     os.path.join(os.path.dirname(os.getcwd()), "Shikimori Updater.exe")
@@ -314,8 +318,29 @@ class Updater:
                     logger.error(f"Available files: {[os.path.basename(f) for f in file_list if not f.endswith('/')]}")
                     return None
                 
-                # Extract only the main application executable directly to temp
-                final_exe_path = os.path.join(temp_dir, f"ShikimoriUpdater_{self.latest_version}.exe")
+                # --onedir releases ship the runtime folder next to the executable
+                exe_prefix = main_exe_entry[:-len(os.path.basename(main_exe_entry))]
+                runtime_prefix = f"{exe_prefix}{RUNTIME_DIR_NAME}/"
+                runtime_entries = [entry for entry in file_list
+                                   if entry.startswith(runtime_prefix) and not entry.endswith('/')]
+                
+                if runtime_entries:
+                    # Extract the executable together with its runtime folder
+                    extract_dir = os.path.join(temp_dir, f"ShikimoriUpdater_{self.latest_version}")
+                    if os.path.exists(extract_dir):
+                        shutil.rmtree(extract_dir)
+                    os.makedirs(extract_dir)
+                    final_exe_path = os.path.join(extract_dir, os.path.basename(main_exe_entry))
+                    
+                    logger.info(f"Extracting {len(runtime_entries)} runtime files to {extract_dir}")
+                    for entry in runtime_entries:
+                        target_path = os.path.join(extract_dir, *entry[len(exe_prefix):].split('/'))
+                        os.makedirs(os.path.dirname(target_path), exist_ok=True)
+                        with zip_ref.open(entry) as source, open(target_path, 'wb') as target:
+                            shutil.copyfileobj(source, target)
+                else:
+                    # Extract only the main application executable directly to temp
+                    final_exe_path = os.path.join(temp_dir, f"ShikimoriUpdater_{self.latest_version}.exe")
                 
                 logger.info(f"Extracting {main_exe_entry} to {final_exe_path}")
                 
@@ -337,6 +362,10 @@ class Updater:
         # Extract just the filename from the current exe path for taskkill
         current_exe_name = os.path.basename(current_exe_path)
         
+        # Runtime folders of --onedir builds (only copied if the update ships one)
+        new_runtime_dir = os.path.join(os.path.dirname(new_exe_path), RUNTIME_DIR_NAME)
+        current_runtime_dir = os.path.join(os.path.dirname(current_exe_path), RUNTIME_DIR_NAME)
+        
         script_content = f'''@echo off
 setlocal enabledelayedexpansion
 set LOG_FILE="%TEMP%\shikimori_update.log"
@@ -404,6 +433,20 @@ if errorlevel 1 (
     echo Update successful!
 )
 
+:: Replace the runtime folder for --onedir builds
+if exist "{new_runtime_dir}" (
+    echo Replacing runtime files...
+    echo %DATE% %TIME% - Copying runtime folder from {new_runtime_dir} to {current_runtime_dir} >> %LOG_FILE%
+    xcopy "{new_runtime_dir}" "{current_runtime_dir}" /E /I /Y /Q >nul
+    if errorlevel 1 (
+        echo ERROR: Failed to copy runtime files!
+        echo %DATE% %TIME% - ERROR: Failed to copy runtime folder >> %LOG_FILE%
+        pause
+        exit /b 1
+    )
+    rmdir /s /q "{new_runtime_dir}" 2>nul
+)
+
 :: Verify the file was actually updated
 echo Verifying update...
 if exist "{current_exe_path}" (
@@ -76,6 +76,29 @@ def wait_for_process_exit(exe_path, timeout=30):
     print(f"Timeout waiting for {exe_name} to exit")
     return False
 
+# PyInstaller --onedir builds keep their runtime files in this folder next to the EXE
+RUNTIME_DIR_NAME = "_internal"
+
+def update_runtime_dir(new_exe_path, target_exe_path):
+    """Copy the runtime folder of a --onedir build next to the target executable"""
+    new_runtime_dir = os.path.join(os.path.dirname(new_exe_path), RUNTIME_DIR_NAME)
+    if not os.path.isdir(new_runtime_dir):
+        # Single-file update, nothing else to copy
+        return True
+    
+    target_runtime_dir = os.path.join(os.path.dirname(target_exe_path), RUNTIME_DIR_NAME)
+    print(f"Updating runtime files:")
+    print(f"  Source: {new_runtime_dir}")
+    print(f"  Target: {target_runtime_dir}")
+    
+    try:
+        shutil.copytree(new_runtime_dir, target_runtime_dir, dirs_exist_ok=True)
+        print("Runtime files updated successfully")
+        return True
+    except Exception as e:
+        print(f"Failed to update runtime files: {e}")
+        return False
+
 def update_executable(new_exe_path, target_exe_path):
     """Replace the target executable with the new one"""
     print(f"Updating executable:")
@@ -177,10 +200,20 @@ def main():
         input("Press Enter to exit...")
         return 1
     
+    # Update the runtime folder of --onedir builds
+    if not update_runtime_dir(args.new_exe, args.target_exe):
+        print("Update failed!")
+        input("Press Enter to exit...")
+        return 1
+    
     # Clean up the new executable
     try:
         os.remove(args.new_exe)
         print(f"Cleaned up temporary file: {args.new_exe}")
+        new_runtime_dir = os.path.join(os.path.dirname(args.new_exe), RUNTIME_DIR_NAME)
+        if os.path.isdir(new_runtime_dir):
+            shutil.rmtree(new_runtime_dir)
+            print(f"Cleaned up temporary folder: {new_runtime_dir}")
     except Exception as e:
         print(f"Warning: Could not clean up temporary file: {e}")
     